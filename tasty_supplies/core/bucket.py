@@ -12,7 +12,7 @@ from beet import Function
 
 from .models import Item, TSContext, Recipe
 from .logger import log
-from .utils import to_item_repr
+from .utils import to_absolute_path, to_item_repr
 
 
 @runtime_checkable
@@ -34,6 +34,27 @@ class AutoCookingRecipeProtocol(Protocol):
 RecipeType = Union[RecipeProtocol, AutoCookingRecipeProtocol]
 
 
+def _get_index_key(value: Any) -> Optional[str]:
+    """Get the key under which an ingredient or result is indexed.
+
+    Custom items are keyed by name and vanilla items (or tags) by their
+    absolute id, so both can share the same index without colliding.
+
+    Args:
+        value: An Item, a vanilla item id or tag, or an item dict
+
+    Returns:
+        The index key, or None if the value cannot be indexed
+    """
+    if isinstance(value, Item):
+        return value.name
+    if isinstance(value, dict):
+        value = value.get("item") or value.get("id")
+    if isinstance(value, str) and value:
+        return to_absolute_path(value)
+    return None
+
+
 class Bucket:
     """A container for managing custom items, recipes, and their metadata.
 
@@ -45,6 +66,10 @@ class Bucket:
         _recipes (List[RecipeProtocol]): List of recipe objects to be registered.
         _item_categories (Dict[str, List[str]]): Dictionary mapping category names to item lists.
         _recipe_categories (Dict[str, List[str]]): Dictionary mapping categories to recipe IDs.
+
+    Reverse indexes (recipes by result, recipes by ingredient, items by base
+    item and result names by category) are maintained as items and recipes
+    are added, so lookups never rescan the whole bucket.
     """
 
     def __init__(self) -> None:
@@ -54,6 +79,15 @@ class Bucket:
         self._item_categories: Dict[str, List[str]] = {}
         self._recipe_categories: Dict[str, List[str]] = {}
         self._recipe_id_counter: Dict[str, int] = {}  # Track recipe_id usage
+        self._frozen: bool = False
+
+        # Reverse indexes
+        self._recipes_by_id: Dict[str, RecipeProtocol] = {}
+        self._recipes_by_result: Dict[str, List[RecipeProtocol]] = {}
+        self._recipes_by_ingredient: Dict[str, List[RecipeProtocol]] = {}
+        self._ingredients: Dict[str, Any] = {}
+        self._items_by_base: Dict[str, List[str]] = {}
+        self._results_by_category: Dict[str, Dict[str, None]] = {}
 
     def add_item(self, item: Item, category: Optional[str] = None) -> None:
         """Add an item to the bucket.
@@ -69,15 +103,28 @@ class Bucket:
             return
 
         self._items[item.name] = item
+        if self._frozen:
+            item.freeze()
 
         # Store in category
         category_key = category or "uncategorized"
         if category_key not in self._item_categories:
             self._item_categories[category_key] = []
         self._item_categories[category_key].append(item.name)
+        self._items_by_base.setdefault(item.base_item, []).append(item.name)
 
         log.debug(f"Added item '{item.name}' to bucket in category '{category_key}'.")
 
+    def freeze_items(self) -> None:
+        """Freeze all items so their payloads are serialized only once.
+
+        Items added to the bucket afterwards are frozen as they are added.
+        """
+        for item in self._items.values():
+            item.freeze()
+        self._frozen = True
+        log.debug(f"Froze {len(self._items)} items.")
+
     def _generate_recipe_id(self, recipe: RecipeProtocol) -> str:
         """Generate a unique recipe_id for a recipe.
 
@@ -148,13 +195,7 @@ class Bucket:
                 if not hasattr(sub_recipe, "recipe_id") or not sub_recipe.recipe_id:
                     sub_recipe.recipe_id = f"{base_id}_{suffixes[i]}"
 
-                self._recipes.append(sub_recipe)
-                if category:
-                    if category not in self._recipe_categories:
-                        self._recipe_categories[category] = []
-
-                    sub_recipe.ts_category = category
-                    self._recipe_categories[category].append(sub_recipe.recipe_id)
+                self._index_recipe(sub_recipe, category)
                 log.debug(
                     f"Added recipe '{sub_recipe.recipe_id}' to bucket (from AutoCookingRecipe)."
                 )
@@ -164,17 +205,41 @@ class Bucket:
             if not hasattr(recipe, "recipe_id") or not recipe.recipe_id:
                 recipe.recipe_id = self._generate_recipe_id(recipe)
 
-            self._recipes.append(recipe)
+            self._index_recipe(recipe, category)
+            log.debug(f"Added recipe '{recipe.recipe_id}' to bucket.")
 
-            # Store in category
-            if category:
-                if category not in self._recipe_categories:
-                    self._recipe_categories[category] = []
+    def _index_recipe(self, recipe: RecipeProtocol, category: Optional[str]) -> None:
+        """Store a recipe and add it to the category and reverse indexes.
 
-                recipe.ts_category = category
-                self._recipe_categories[category].append(recipe.recipe_id)
+        Args:
+            recipe: The recipe object, with its recipe_id already assigned.
+            category: Category name to organize recipes (optional).
+        """
+        self._recipes.append(recipe)
+        self._recipes_by_id[recipe.recipe_id] = recipe
 
-            log.debug(f"Added recipe '{recipe.recipe_id}' to bucket.")
+        result_key = _get_index_key(getattr(recipe, "result", None))
+        if result_key:
+            self._recipes_by_result.setdefault(result_key, []).append(recipe)
+
+        # Store in category
+        if category:
+            if category not in self._recipe_categories:
+                self._recipe_categories[category] = []
+
+            recipe.ts_category = category
+            self._recipe_categories[category].append(recipe.recipe_id)
+            if result_key:
+                self._results_by_category.setdefault(category, {})[result_key] = None
+
+        indexed: set = set()
+        for ingredient in recipe.get_ingredients():
+            key = _get_index_key(ingredient)
+            if not key or key in indexed:
+                continue
+            indexed.add(key)
+            self._ingredients.setdefault(key, ingredient)
+            self._recipes_by_ingredient.setdefault(key, []).append(recipe)
 
     def get(self, item_name: str) -> Optional[Item]:
         """Retrieve an item by name.
@@ -220,6 +285,65 @@ class Bucket:
         """
         return self._recipes
 
+    def get_recipe(self, recipe_id: str) -> Optional[Recipe]:
+        """Retrieve a recipe by its ID.
+
+        Args:
+            recipe_id: The recipe ID.
+
+        Returns:
+            The recipe if found, None otherwise.
+        """
+        return self._recipes_by_id.get(recipe_id)
+
+    def get_recipes_by_result(self, result: Union[Item, str]) -> List[Recipe]:
+        """Get all recipes producing an item.
+
+        Args:
+            result: A custom Item (or its name) or a vanilla item id.
+
+        Returns:
+            List of recipes in insertion order, or empty list if none.
+        """
+        if isinstance(result, str) and result in self._items:
+            result = self._items[result]
+        return self._recipes_by_result.get(_get_index_key(result), []).copy()
+
+    def get_recipes_by_ingredient(self, ingredient: Union[Item, str]) -> List[Recipe]:
+        """Get all recipes using an ingredient.
+
+        Args:
+            ingredient: A custom Item (or its name), a vanilla item id or a tag.
+
+        Returns:
+            List of recipes in insertion order, or empty list if none.
+        """
+        if isinstance(ingredient, str) and ingredient in self._items:
+            ingredient = self._items[ingredient]
+        return self._recipes_by_ingredient.get(_get_index_key(ingredient), []).copy()
+
+    def get_items_by_base_item(self, base_item: str) -> List[str]:
+        """Get all custom item names built on a vanilla base item.
+
+        Args:
+            base_item: The base item id (e.g. "bread").
+
+        Returns:
+            List of item names, or empty list if none.
+        """
+        return self._items_by_base.get(base_item, []).copy()
+
+    def get_results_by_category(self, category: str) -> List[str]:
+        """Get the unique result names of the recipes in a category.
+
+        Args:
+            category: The category name.
+
+        Returns:
+            List of result names in insertion order, or empty list if not found.
+        """
+        return list(self._results_by_category.get(category, {}))
+
     def get_items_by_category(self, category: str) -> List[str]:
         """Get all item names in a specific category.
 
@@ -296,8 +420,9 @@ class Bucket:
             ctx: The Beet context to register with.
         """
         # Register all items first
+        component_names = self.export_component_names()
         for item_name, item in self._items.items():
-            item.register(ctx)
+            item.register(ctx, component_names)
             log.debug(f"Registered item '{item_name}' with context.")
 
         # Then register all recipes
@@ -317,10 +442,7 @@ class Bucket:
             ctx: The Tasty Supplies context
         """
         for item_name, item in self._items.items():
-            item_repr = to_item_repr(item)
-            count = item.to_result().get("count", 1)
-
-            give_command: str = f"give @s {item_repr} {count}"
+            give_command: str = f"give @s {to_item_repr(item)} 1"
 
             ctx.data["tasty_supplies"].functions[f"give/{item_name}"] = Function(
                 [give_command]
@@ -349,13 +471,38 @@ class Bucket:
         Returns:
             Dict[str, List[str]]: Dictionary mapping base item names to lists of custom items using that base.
         """
-        by_base: Dict[str, List[str]] = {}
-        for item_name, item in self._items.items():
-            base: str = item.base_item
-            if base not in by_base:
-                by_base[base] = []
-            by_base[base].append(item_name)
-        return by_base
+        return {base: names[:] for base, names in self._items_by_base.items()}
+
+    def export_component_names(self) -> List[str]:
+        """Export the names of the components used by at least one item.
+
+        Returns:
+            List[str]: Sorted list of component names.
+        """
+        names = set()
+        for item in self._items.values():
+            names.update(item.nbt["components"])
+        return sorted(names)
+
+    def export_recipes_by_result(self) -> Dict[str, List[Recipe]]:
+        """Export recipes grouped by their result.
+
+        Returns:
+            Dict[str, List[Recipe]]: Dictionary mapping result keys (custom item names
+            or vanilla ids) to recipes, in order of first appearance.
+        """
+        return {
+            result: recipes[:] for result, recipes in self._recipes_by_result.items()
+        }
+
+    def export_ingredients(self) -> List[Any]:
+        """Export the unique ingredients used by all recipes.
+
+        Returns:
+            List of ingredients (Items, vanilla ids, tags or dicts), in order of
+            first appearance.
+        """
+        return list(self._ingredients.values())
 
     def export_summary(self) -> Dict[str, Any]:
         """Export a summary of all items, recipes, and categories in the bucket.
@@ -389,6 +536,13 @@ class Bucket:
         self._recipes.clear()
         self._item_categories.clear()
         self._recipe_categories.clear()
+        self._recipes_by_id.clear()
+        self._recipes_by_result.clear()
+        self._recipes_by_ingredient.clear()
+        self._ingredients.clear()
+        self._items_by_base.clear()
+        self._results_by_category.clear()
+        self._frozen = False
         log.debug("Bucket cleared.")
 
     def __repr__(self) -> str:
@@ -0,0 +1,134 @@
+"""Persistent build cache for Tasty Supplies.
+
+The cache keeps the results of expensive work, such as decoding the glyph
+textures of the recipe book font, in the beet project cache. Entries are keyed
+by a content hash of their inputs, and the whole cache is dropped whenever the
+source code of the generator changes, so stale results are never reused.
+
+The cache can be disabled with the `tasty_supplies.build_cache` meta option:
+
+    meta:
+      tasty_supplies:
+        build_cache: false
+"""
+
+import copy
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from beet import Context, File
+
+from .logger import log
+
+CACHE_NAME = "tasty_supplies"
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+def hash_json(data: Any) -> str:
+    """Return the SHA1 of the canonical JSON representation of `data`."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def hash_source() -> str:
+    """Return the SHA1 of the Python source files of the generator."""
+    sha1 = hashlib.sha1()
+    for path in sorted(PROJECT_DIR.rglob("*.py")):
+        sha1.update(path.relative_to(PROJECT_DIR).as_posix().encode("utf-8"))
+        sha1.update(path.read_bytes())
+    return sha1.hexdigest()
+
+
+def read_file_bytes(file: File) -> bytes:
+    """Return the serialized content of a beet file as bytes.
+
+    Files loaded from disk or from a zip are read without being deserialized.
+    """
+    content = file.get_content()
+    if not isinstance(content, (bytes, str)):
+        content = file.serialize(content)
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return content
+
+
+class BuildCache:
+    """Content-addressed cache of expensive results, persisted across builds.
+
+    Entries are grouped by section ("glyph_advances", ...) and stored under
+    their name along with the key they were computed for. An entry is only
+    returned when the stored key matches the current one.
+    """
+
+    def __init__(self, ctx: Context, enabled: bool = True):
+        """Initialize the build cache.
+
+        Args:
+            ctx: The Beet context whose project cache stores the entries
+            enabled: When False, every lookup misses and nothing is stored
+        """
+        self.enabled = enabled
+        self.hits: int = 0
+        self.misses: int = 0
+        self._used: Dict[str, Set[str]] = {}
+        self._data: Dict[str, Any] = {}
+
+        if not enabled:
+            return
+
+        source = hash_source()
+        self._data = ctx.cache[CACHE_NAME].json
+        if self._data.get("source") != source:
+            self._data.clear()
+            self._data["source"] = source
+
+    def get(self, section: str, name: str, key: str) -> Optional[Any]:
+        """Return the cached value of an entry if its key is unchanged.
+
+        Args:
+            section: The cache section (e.g. "glyph_advances")
+            name: The entry name within the section
+            key: The content hash of the entry inputs
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        self._used.setdefault(section, set()).add(name)
+        entry = self._data.get(section, {}).get(name)
+
+        if entry is not None and entry["key"] == key:
+            self.hits += 1
+            return copy.deepcopy(entry["value"])
+
+        self.misses += 1
+        return None
+
+    def set(self, section: str, name: str, key: str, value: Any) -> None:
+        """Store the value of an entry for the given key.
+
+        Args:
+            section: The cache section (e.g. "glyph_advances")
+            name: The entry name within the section
+            key: The content hash of the entry inputs
+            value: JSON-serializable value to store
+        """
+        self._used.setdefault(section, set()).add(name)
+        if self.enabled:
+            self._data.setdefault(section, {})[name] = {
+                "key": key,
+                "value": copy.deepcopy(value),
+            }
+
+    def prune(self) -> None:
+        """Drop entries of the visited sections that were not used this build."""
+        for section, names in self._used.items():
+            entries = self._data.get(section, {})
+            for name in set(entries) - names:
+                del entries[name]
+
+    def log_summary(self) -> None:
+        """Log the number of entries reused and recomputed."""
+        if self.enabled:
+            log.info(f"Build cache: {self.hits} reused, {self.misses} recomputed")
@@ -2,3 +2,33 @@
 
 DEFAULT_MAX_STACK_SIZE = 64
 DEFAULT_BASE_ITEM = "bread"
+
+# Components every vanilla item has by default
+DEFAULT_COMPONENTS = frozenset(
+    {
+        "attribute_modifiers",
+        "break_sound",
+        "enchantments",
+        "item_model",
+        "item_name",
+        "lore",
+        "max_stack_size",
+        "rarity",
+        "repair_cost",
+        "tooltip_display",
+    }
+)
+
+# Other default components of the vanilla items used as base items
+BASE_ITEM_COMPONENTS = {
+    "bread": frozenset({"consumable", "food"}),
+    "leather_helmet": frozenset(
+        {"damage", "enchantable", "equippable", "max_damage", "repairable"}
+    ),
+    "poisonous_potato": frozenset({"consumable", "food"}),
+    "potion": frozenset({"consumable", "potion_contents", "use_remainder"}),
+    "rabbit_stew": frozenset({"consumable", "food", "use_remainder"}),
+    "wooden_sword": frozenset(
+        {"damage", "enchantable", "max_damage", "repairable", "tool", "weapon"}
+    ),
+}
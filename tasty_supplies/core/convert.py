@@ -1,3 +1,4 @@
+import copy
 import json
 import re
 
@@ -47,41 +48,190 @@ class Token:
         return None, None
 
 
-def convert_data(ctx: TSContext, bucket: Bucket) -> None:
-    expr_regex = r"\"\$(.+)\""
+class VanillaIndex:
+    """Index of the vanilla data files, built once per build.
+
+    The vanilla data pack is scanned once into a path -> file map on the first
+    lookup. File contents are parsed lazily and memoized, so each merge costs
+    one lookup and a deep copy.
+    """
+
+    def __init__(self, ctx: TSContext):
+        self._ctx = ctx
+        self._files: dict | None = None
+        self._json: dict[str, object] = {}
+
+    def _get_files(self) -> dict:
+        if self._files is None:
+            self._files = {}
+            for path, namespace_file in self._ctx.vanilla.data.all():
+                self._files.setdefault(path, namespace_file)
+        return self._files
+
+    def get_json(self, path: str):
+        """Return a copy of the parsed content of a vanilla file.
+
+        Raises:
+            FileNotFoundError: If there is no vanilla file at this path
+        """
+        if path not in self._json:
+            namespace_file = self._get_files().get(path)
+            if namespace_file is None:
+                raise FileNotFoundError(f"Vanilla file '{path}' not found in context.")
+            self._json[path] = json.loads(str(namespace_file.get_content()))
+        return copy.deepcopy(self._json[path])
 
-    tokens: list[Token] = []
 
-    for path, namespace in list(ctx.data.all()):
-        content = str(namespace.get_content())
-        matches = re.finditer(expr_regex, content, re.MULTILINE)
+EXPR_REGEX = re.compile(r"\"\$(.+)\"", re.MULTILINE)
 
-        for matchNum, match in enumerate(matches, start=1):
-            if matchNum > 0:
-                source = match.group()
-                expression = match.group(1)
 
-                tokens.append(Token(path, source, expression))
+def convert_data(ctx: TSContext, bucket: Bucket) -> None:
+    """Evaluate the template expressions of every data file.
+
+    Tokens are grouped by file, so each template file is parsed once,
+    all its expressions are evaluated together and it is rewritten once.
+    """
+    item_values: dict[str, object] = {}
+    vanilla = VanillaIndex(ctx)
+
+    for path, namespace_file in list(ctx.data.all()):
+        content = str(namespace_file.get_content())
+        tokens = [
+            Token(path, match.group(), match.group(1))
+            for match in EXPR_REGEX.finditer(content)
+        ]
+
+        if tokens:
+            convert_file(vanilla, bucket, namespace_file, content, tokens, item_values)
+
+
+def convert_file(
+    vanilla: VanillaIndex,
+    bucket: Bucket,
+    namespace_file,
+    content: str,
+    tokens: list[Token],
+    item_values: dict[str, object] | None = None,
+) -> None:
+    """Evaluate all the tokens of a file and rewrite it once.
+
+    Args:
+        vanilla: The vanilla data index used by merge expressions
+        bucket: The bucket used to resolve item expressions
+        namespace_file: The file containing the tokens
+        content: The current content of the file
+        tokens: The tokens found in the file
+        item_values: Cache of evaluated item expressions, shared across files
+    """
+    if item_values is None:
+        item_values = {}
+
+    # Maps the source of each item token to its evaluated value
+    replacements: dict[str, object] = {}
+    merge_keys: list[str] = []
 
     for token in tokens:
         split_expr = token.split_expression()
         expr_type = split_expr[0]
 
         if expr_type == "item":
-            replace_item_expr(ctx, bucket, token)
+            if token.expression not in item_values:
+                item_values[token.expression] = evaluate_item_expr(bucket, token)
+            replacements[token.source] = item_values[token.expression]
         elif expr_type == "merge":
-            replace_merge_expr(ctx, token)
+            merge_path = split_expr[1:]
+            merge_key = f"$merge.{'.'.join(merge_path)}" if merge_path else "$merge"
+            if merge_key not in merge_keys:
+                merge_keys.append(merge_key)
         elif expr_type == "recipe":
             pass
 
+    if not replacements and not merge_keys:
+        return
+
+    try:
+        json_content = json.loads(content)
+    except ValueError as e:
+        if merge_keys:
+            log.error(f"Failed to parse JSON content: {e}")
+        _replace_text(namespace_file, content, replacements)
+        return
+
+    values = {_token_value(source): value for source, value in replacements.items()}
+
+    merged = None
+    if merge_keys:
+        merged = _apply_merges(vanilla, tokens[0].path, content, merge_keys, values)
+
+    if merged is not None:
+        json_content = merged
+    elif replacements:
+        json_content = _substitute(json_content, values)
+    else:
+        return
+
+    namespace_file.set_content(
+        json.dumps(
+            json_content,
+            indent=4,
+            sort_keys=True,
+        )
+    )
+
+
+def _token_value(source: str) -> str:
+    """Return the JSON string value of a token source (quotes included)."""
+    try:
+        return json.loads(source)
+    except ValueError:
+        return source[1:-1]
+
+
+def _substitute(data, values: dict[str, object]):
+    """Replace every string value matching an evaluated token."""
+    if isinstance(data, dict):
+        return {key: _substitute(value, values) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_substitute(value, values) for value in data]
+    if isinstance(data, str) and data in values:
+        value = values[data]
+        if isinstance(value, str):
+            # String results are raw JSON fragments
+            try:
+                return json.loads(value)
+            except ValueError:
+                return value
+        return value
+    return data
+
+
+def _replace_text(namespace_file, content: str, replacements: dict[str, object]):
+    """Substitute the item tokens of a non-JSON file in a single pass."""
+    if not replacements:
+        return
+
+    def replace(match: re.Match) -> str:
+        source = match.group()
+        if source not in replacements:
+            return source
+        value = replacements[source]
+        return value if isinstance(value, str) else json.dumps(value)
+
+    content = EXPR_REGEX.sub(replace, content)
+
+    try:
+        json_content = json.loads(content)
+    except ValueError:
+        namespace_file.set_content(content)
+        return
 
-def get_vanilla_file(ctx: TSContext, path: str):
-    files = list(ctx.vanilla.data.all(path))
-    if not files:
-        raise FileNotFoundError(f"Vanilla file '{path}' not found in context.")
-    namespace_file = files[0][1]
-    content = str(namespace_file.get_content())
-    return json.loads(content)
+    namespace_file.set_content(
+        json.dumps(
+            json_content,
+            indent=4,
+            sort_keys=True,
+        )
+    )
 
 
 def deep_merge(dest, key, value):
@@ -94,26 +244,25 @@ def deep_merge(dest, key, value):
     return dest
 
 
-def replace_merge_expr(ctx: TSContext, token: Token) -> None:
-    processed = getattr(ctx, "_processed_merge_exprs", None)
-    if processed is None:
-        processed = set()
-        setattr(ctx, "_processed_merge_exprs", processed)
-
-    processed_key = (token.path, token.expression)
-    if processed_key in processed:
-        log.debug("Merge for %s already handled, skipping.", processed_key)
-        return
-
-    split_expr = token.split_expression()
-
-    merge_path = split_expr[1:]
-    merge_expr_key = f"$merge.{'.'.join(merge_path)}" if merge_path else "$merge"
-
-    file = list(ctx.data.all(token.path))[0]
-    namespace_file = file[1]
-    content = str(namespace_file.get_content())
-
+def _apply_merges(
+    vanilla: VanillaIndex,
+    path: str,
+    content: str,
+    merge_keys: list[str],
+    values: dict[str, object],
+):
+    """Merge the `$merge` entries of a custom file into its vanilla file.
+
+    Args:
+        vanilla: The vanilla data index
+        path: The resource location of the file
+        content: The content of the custom file
+        merge_keys: The `$merge...` keys to apply
+        values: Evaluated item tokens to substitute in the custom data
+
+    Returns:
+        The merged JSON data, or None if nothing could be merged
+    """
     merge_entries: dict[str, list] = {}
 
     def capture_pairs(pairs: list[tuple[str, object]]):
@@ -127,151 +276,148 @@ def replace_merge_expr(ctx: TSContext, token: Token) -> None:
             obj[key] = value
         return obj
 
-    try:
-        custom_json = json.loads(content, object_pairs_hook=capture_pairs)
-    except Exception as e:
-        log.error(f"Failed to parse JSON content: {e}")
-        return
+    custom_json = json.loads(content, object_pairs_hook=capture_pairs)
 
-    merge_values = merge_entries.get(merge_expr_key, [])
-    if not merge_values:
-        log.warning("No merge values found for key %s.", merge_expr_key)
-        return
+    merges = []
+    for merge_key in merge_keys:
+        merge_values = merge_entries.get(merge_key, [])
+        if not merge_values:
+            log.warning("No merge values found for key %s.", merge_key)
+            continue
+        merge_path = merge_key.split(".")[1:]
+        merges.extend((merge_path, value) for value in merge_values)
+
+    if not merges:
+        return None
 
     try:
-        vanilla_json = get_vanilla_file(ctx, token.path)
+        vanilla_json = vanilla.get_json(path)
     except FileNotFoundError as e:
         log.error(f"Vanilla file not found: {e}")
-        return
+        return None
 
-    def deep_merge_json(a, b):
-        if isinstance(a, dict) and isinstance(b, dict):
-            for k, v in b.items():
-                if k in a:
-                    a[k] = deep_merge_json(a[k], v)
-                else:
-                    a[k] = v
-            return a
-        if isinstance(a, list) and isinstance(b, list):
-            return a + b
-        return b
-
-    def parse_path_component(component):
-        """Parse a path component to handle both dict keys and array indices.
-
-        Returns (key_or_index, is_index) tuple.
-        """
-        if component.isdigit():
-            return int(component), True
-        return component, False
-
-    def ensure_path(obj, path):
-        """Navigate to the parent of the final key, handling both dicts and arrays."""
-        current = obj
-        for i, component in enumerate(path[:-1]):
-            key_or_index, is_index = parse_path_component(component)
-
-            if is_index:
-                # Navigate through array index
-                if not isinstance(current, list) or key_or_index >= len(current):
-                    log.error(
-                        "Array index %d out of bounds or current is not a list",
-                        key_or_index,
-                    )
-                    return None, None
-                current = current[key_or_index]
+    for merge_path, merge_value in merges:
+        vanilla_json = _apply_merge_value(
+            vanilla_json, merge_path, _substitute(merge_value, values)
+        )
+
+    return _deep_merge_json(vanilla_json, _substitute(custom_json, values))
+
+
+def _deep_merge_json(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        for k, v in b.items():
+            if k in a:
+                a[k] = _deep_merge_json(a[k], v)
             else:
-                # Navigate through dict key
-                if not isinstance(current, dict):
-                    log.error(
-                        "Expected dict at path component %d but got %s",
-                        i,
-                        type(current),
-                    )
-                    return None, None
-                if key_or_index not in current or not isinstance(
-                    current[key_or_index], (dict, list)
-                ):
-                    current[key_or_index] = {}
-                current = current[key_or_index]
-
-        return current, path[-1] if path else None
-
-    def apply_merge_value(target_json, path, value):
-        if not path:
-            return deep_merge_json(target_json, value)
-
-        parent, final_component = ensure_path(target_json, path)
-        if parent is None or final_component is None:
-            log.error("Failed to navigate path: %s", path)
-            return target_json
+                a[k] = v
+        return a
+    if isinstance(a, list) and isinstance(b, list):
+        return a + b
+    return b
+
+
+def _parse_path_component(component):
+    """Parse a path component to handle both dict keys and array indices.
 
-        final_key, is_index = parse_path_component(final_component)
+    Returns (key_or_index, is_index) tuple.
+    """
+    if component.isdigit():
+        return int(component), True
+    return component, False
+
+
+def _ensure_path(obj, path):
+    """Navigate to the parent of the final key, handling both dicts and arrays."""
+    current = obj
+    for i, component in enumerate(path[:-1]):
+        key_or_index, is_index = _parse_path_component(component)
 
         if is_index:
-            # Merge into array element
-            if not isinstance(parent, list):
-                log.error("Expected list for array index but got %s", type(parent))
-                return target_json
-            if final_key >= len(parent):
-                log.error("Array index %d out of bounds", final_key)
-                return target_json
-
-            current_value = parent[final_key]
-            if isinstance(value, list):
-                if not isinstance(current_value, list):
-                    log.debug(
-                        "Overriding non-list value at index %d with list merge.",
-                        final_key,
-                    )
-                    parent[final_key] = []
-                parent[final_key].extend(value)
-            elif isinstance(value, dict):
-                if not isinstance(current_value, dict):
-                    parent[final_key] = {}
-                parent[final_key] = deep_merge_json(parent[final_key], value)
-            else:
-                parent[final_key] = value
+            # Navigate through array index
+            if not isinstance(current, list) or key_or_index >= len(current):
+                log.error(
+                    "Array index %d out of bounds or current is not a list",
+                    key_or_index,
+                )
+                return None, None
+            current = current[key_or_index]
         else:
-            # Merge into dict key
-            if not isinstance(parent, dict):
-                log.error("Expected dict for key but got %s", type(parent))
-                return target_json
-
-            if final_key not in parent:
-                parent[final_key] = [] if isinstance(value, list) else {}
-
-            current_value = parent[final_key]
-            if isinstance(value, list):
-                if not isinstance(current_value, list):
-                    log.debug(
-                        "Overriding non-list value at %s with list merge.", final_key
-                    )
-                    parent[final_key] = []
-                parent[final_key].extend(value)
-            elif isinstance(value, dict):
-                if not isinstance(current_value, dict):
-                    parent[final_key] = {}
-                parent[final_key] = deep_merge_json(parent[final_key], value)
-            else:
-                parent[final_key] = value
+            # Navigate through dict key
+            if not isinstance(current, dict):
+                log.error(
+                    "Expected dict at path component %d but got %s",
+                    i,
+                    type(current),
+                )
+                return None, None
+            if key_or_index not in current or not isinstance(
+                current[key_or_index], (dict, list)
+            ):
+                current[key_or_index] = {}
+            current = current[key_or_index]
+
+    return current, path[-1] if path else None
+
+
+def _apply_merge_value(target_json, path, value):
+    if not path:
+        return _deep_merge_json(target_json, value)
 
+    parent, final_component = _ensure_path(target_json, path)
+    if parent is None or final_component is None:
+        log.error("Failed to navigate path: %s", path)
         return target_json
 
-    for merge_value in merge_values:
-        vanilla_json = apply_merge_value(vanilla_json, merge_path, merge_value)
+    final_key, is_index = _parse_path_component(final_component)
 
-    vanilla_json = deep_merge_json(vanilla_json, custom_json)
+    if is_index:
+        # Merge into array element
+        if not isinstance(parent, list):
+            log.error("Expected list for array index but got %s", type(parent))
+            return target_json
+        if final_key >= len(parent):
+            log.error("Array index %d out of bounds", final_key)
+            return target_json
 
-    namespace_file.set_content(
-        json.dumps(
-            vanilla_json,
-            indent=4,
-            sort_keys=True,
-        )
-    )
+        current_value = parent[final_key]
+        if isinstance(value, list):
+            if not isinstance(current_value, list):
+                log.debug(
+                    "Overriding non-list value at index %d with list merge.",
+                    final_key,
+                )
+                parent[final_key] = []
+            parent[final_key].extend(value)
+        elif isinstance(value, dict):
+            if not isinstance(current_value, dict):
+                parent[final_key] = {}
+            parent[final_key] = _deep_merge_json(parent[final_key], value)
+        else:
+            parent[final_key] = value
+    else:
+        # Merge into dict key
+        if not isinstance(parent, dict):
+            log.error("Expected dict for key but got %s", type(parent))
+            return target_json
 
-    processed.add(processed_key)
+        if final_key not in parent:
+            parent[final_key] = [] if isinstance(value, list) else {}
+
+        current_value = parent[final_key]
+        if isinstance(value, list):
+            if not isinstance(current_value, list):
+                log.debug("Overriding non-list value at %s with list merge.", final_key)
+                parent[final_key] = []
+            parent[final_key].extend(value)
+        elif isinstance(value, dict):
+            if not isinstance(current_value, dict):
+                parent[final_key] = {}
+            parent[final_key] = _deep_merge_json(parent[final_key], value)
+        else:
+            parent[final_key] = value
+
+    return target_json
 
 
 def is_method_expression(expression: str) -> bool:
@@ -279,7 +425,12 @@ def is_method_expression(expression: str) -> bool:
     return re.match(method_regex, expression) is not None
 
 
-def replace_item_expr(ctx: TSContext, bucket: Bucket, token: Token) -> None:
+def evaluate_item_expr(bucket: Bucket, token: Token):
+    """Evaluate an `$item.<name>.<property|method(...)>` expression.
+
+    Returns:
+        The evaluated value, a dict or a raw string
+    """
     split_expr = token.split_expression()
     expr_item = split_expr[1]
     item = bucket.get(expr_item)
@@ -318,22 +469,4 @@ def replace_item_expr(ctx: TSContext, bucket: Bucket, token: Token) -> None:
     if not isinstance(result, (dict, str)):
         raise TypeError("Invalid type result of property.")
 
-    if isinstance(result, dict):
-        result = json.dumps(result)
-
-    file = list(ctx.data.all(token.path))[0]
-    namespace_file = file[1]
-    content = str(namespace_file.get_content())
-    content = content.replace(token.source, result, 1)
-
-    try:
-        json_content = json.loads(content)
-        namespace_file.set_content(
-            json.dumps(
-                json_content,
-                indent=4,
-                sort_keys=True,
-            )
-        )
-    except ValueError as e:
-        namespace_file.set_content(content)
+    return result
@@ -0,0 +1,122 @@
+"""Release hash manifest for Tasty Supplies.
+
+Every build writes the project version, and the hash and version stamp of
+each item, to `tasty_supplies_manifest.json` next to the build output. The
+manifest of a previous release can be given with the
+`tasty_supplies.previous_manifest` meta option to report the items changed
+since that release:
+
+    meta:
+      tasty_supplies:
+        previous_manifest: path/to/tasty_supplies_manifest.json
+
+It must come from an earlier release than the one being built. The updater
+always knows the version of every item, since stacks of any older release
+can still be found in the world.
+
+The manifest also holds the pack version, a stamp of all item versions that
+tells the updater whether a player was already scanned for this release.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from beet import Context
+
+from .build_cache import hash_json
+from .logger import log
+from .utils import to_version_stamp
+
+MANIFEST_NAME = "tasty_supplies_manifest.json"
+MANIFEST_VERSION = 2
+
+
+class HashManifest:
+    """Item hashes of the current build and of the previous release."""
+
+    def __init__(self, ctx: Context, previous_path: Optional[str] = None):
+        """Initialize the manifest.
+
+        Args:
+            ctx: The Beet context whose output directory receives the manifest
+            previous_path: Manifest of the previous release, relative to the
+                project directory (optional)
+        """
+        self.release: str = ctx.project_version
+        self.items: Dict[str, str] = {}
+        self.versions: Dict[str, int] = {}
+        self.previous: Optional[Dict[str, str]] = None
+        self.previous_release: Optional[str] = None
+        self._manifest_dir = Path(ctx.output_directory or ctx.directory)
+
+        if previous_path:
+            previous = self._load(Path(ctx.directory) / previous_path)
+            self.previous = previous["items"]
+            self.previous_release = previous["release"]
+
+    def _load(self, path: Path) -> Dict[str, Any]:
+        data = json.loads(path.read_text())
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version in {path}.")
+        if not data.get("release") or data["release"] == self.release:
+            raise ValueError(
+                f"{path} is not the manifest of a previous release "
+                f"(building release {self.release})."
+            )
+        return data
+
+    def track(self, name: str, sha1: str, version: int) -> None:
+        """Record the hash and version stamp of an item.
+
+        Args:
+            name: The item name
+            sha1: The current hash of the item
+            version: The version stamp of the item stacks
+        """
+        self.items[name] = sha1
+        self.versions[name] = version
+
+    def get_changed_items(self) -> List[str]:
+        """Get the items whose hash changed since the previous release.
+
+        Returns:
+            The item names, empty without a previous manifest
+        """
+        if self.previous is None:
+            return []
+        return [
+            name
+            for name, sha1 in self.items.items()
+            if name in self.previous and self.previous[name] != sha1
+        ]
+
+    def get_pack_version(self) -> int:
+        """Get the version stamp of the pack, derived from every item stamp."""
+        return to_version_stamp(hash_json(self.versions))
+
+    def write(self) -> Path:
+        """Write the manifest of the current build.
+
+        Returns:
+            The path of the manifest
+        """
+        if self.previous is not None:
+            changed = len(self.get_changed_items())
+            log.info(f"{changed} items changed since release {self.previous_release}")
+
+        path = self._manifest_dir / MANIFEST_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {
+                    "version": MANIFEST_VERSION,
+                    "release": self.release,
+                    "pack_version": self.get_pack_version(),
+                    "items": self.items,
+                    "versions": self.versions,
+                },
+                indent=4,
+            )
+        )
+        return path
@@ -1,9 +1,18 @@
 from beet import Context
 from beet.contrib.vanilla import Vanilla
 
+from ..build_cache import BuildCache
+from ..manifest import HashManifest
+from ..profiler import BuildProfiler, is_profiling_enabled
+
 
 class TSContext(Context):
     def __init__(self, ctx: Context):
         version: str = "1.21"
         self.__dict__ = ctx.__dict__.copy()
         self.vanilla = Vanilla(ctx=self, minecraft_version=version)
+
+        options: dict = self.meta.get("tasty_supplies", {})
+        self.build_cache = BuildCache(self, options.get("build_cache", True))
+        self.hash_manifest = HashManifest(self, options.get("previous_manifest"))
+        self.profiler = BuildProfiler(self, is_profiling_enabled(self))
@@ -1,14 +1,18 @@
+import copy
 import hashlib
 import json
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
 from enum import Enum
 
-from beet import Function, Model, ItemModel
+from beet import Function, Model, ItemModel, ItemModifier
 
 from .context import TSContext
-from ..utils import to_absolute_path, to_item_repr
+from ..utils import to_absolute_path, format_item_repr, to_version_stamp
 from ..logger import log
 from ..constants import (
+    BASE_ITEM_COMPONENTS,
+    DEFAULT_COMPONENTS,
     DEFAULT_MAX_STACK_SIZE,
     DEFAULT_BASE_ITEM,
 )
@@ -21,11 +25,29 @@ class Rarity(Enum):
     EPIC = "epic"
 
 
+# Attributes whose value is part of the item payload (nbt, hash, SNBT), they
+# cannot be reassigned once the item is frozen.
+_PAYLOAD_ATTRS = frozenset({"name", "base_item", "components"})
+
+
+@dataclass(frozen=True)
+class _ItemPayload:
+    """Serialized forms of an item, computed once per frozen state."""
+
+    nbt_json: str
+    sha1: str
+    version: int
+    item_repr: str
+
+
 class Item:
     """Represents a custom Minecraft item with its visual properties.
 
     Items are independent from recipes and can be referenced by any recipe.
     They define how the item looks and which base Minecraft item it uses.
+
+    Once frozen (see `freeze`), the serialized payload of the item (nbt, hash
+    and SNBT) is computed once and the item must not be modified anymore.
     """
 
     def __init__(
@@ -48,6 +70,9 @@ class Item:
             model_type: Either "item" or "block" to determine texture location
             **components: Item components (food, consumable, max_stack_size, etc.)
         """
+        self.frozen: bool = False
+        self._payload: Optional[_ItemPayload] = None
+
         self.name = item_name
         self.base_item = base_item
         self.texture_path = texture_path or f"tasty_supplies:{model_type}/{item_name}"
@@ -72,7 +97,32 @@ class Item:
         self.components.setdefault("item_name", display_name)
         self.components.setdefault("rarity", rarity.value)
 
-    def register(self, ctx: TSContext):
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key in _PAYLOAD_ATTRS and getattr(self, "frozen", False):
+            raise AttributeError(f"Cannot set '{key}' of frozen item '{self.name}'.")
+        super().__setattr__(key, value)
+
+    def freeze(self) -> None:
+        """Compute and cache the serialized payload of this item.
+
+        The item must not be modified afterwards, all its components must be
+        set before (i.e. in `create_items`).
+        """
+        if not self.frozen:
+            self._payload = self._get_payload()
+            self.frozen = True
+
+    def _get_payload(self) -> _ItemPayload:
+        if self._payload is not None:
+            return self._payload
+
+        nbt = self._raw_nbt()
+        sha1 = self._hash_nbt(nbt)
+        version = to_version_stamp(sha1)
+        nbt["components"].setdefault("custom_data", {})["ts_version"] = version
+        return _ItemPayload(json.dumps(nbt), sha1, version, format_item_repr(nbt))
+
+    def register(self, ctx: TSContext, component_names: Iterable[str] = ()):
         """Register this item with the Beet context.
 
         This creates the necessary model and item_model files and registers
@@ -80,6 +130,8 @@ class Item:
 
         Args:
             ctx: The Tasty Supplies context
+            component_names: The components used across the whole catalog,
+                the updater removes those this item does not define
         """
         if not ctx.assets["tasty_supplies"].models.get(f"item/{self.name}"):
             ctx.assets["tasty_supplies"].models[f"item/{self.name}"] = self._get_model()
@@ -89,7 +141,20 @@ class Item:
         if not self._texture_path_exist(ctx):
             log.warning(f"Non-existent texture for item '{self.name}.'")
 
-        self._setup_sha1_updater(ctx)
+        components = self.nbt["components"]
+        ctx.hash_manifest.track(self.name, self._to_sha1(), self._to_version())
+        removed = self._get_removed_components(component_names)
+        for modifier_path, modifier in self._get_updater_modifiers(
+            components, removed
+        ).items():
+            ctx.data["tasty_supplies"].item_modifiers[modifier_path] = ItemModifier(
+                modifier
+            )
+
+        for function_path, lines in self._get_updater_lines().items():
+            ctx.data["tasty_supplies"].functions.get(function_path).append(
+                Function(lines)
+            )
 
     def _texture_path_exist(self, ctx: TSContext) -> bool:
         return not ctx.assets.textures.get(self.texture_path) is None
@@ -106,22 +171,28 @@ class Item:
 
         model_path = f"tasty_supplies:item/{self.name}"
         for candidate in item_model["model"]["cases"]:
-            if candidate["model"]["model"] == model_path:
+            if candidate["model"].get("model") == model_path:
                 log.warning(
                     f"Item model case for {self.name} already exists in "
                     f"minecraft:items/{self.base_item}. Skipping model registration."
                 )
                 return
 
-        item_model["model"]["cases"].append(
-            {
-                "when": f"tasty_supplies/{self.name}",
-                "model": {
-                    "type": "minecraft:model",
-                    "model": model_path,
-                },
-            }
-        )
+        item_model["model"]["cases"].append(self._get_model_case())
+
+    def _get_model_case(self) -> Dict[str, Any]:
+        """Generate the custom model data case selecting this item's model.
+
+        Returns:
+            Dict with the case to add to the base item model
+        """
+        return {
+            "when": f"tasty_supplies/{self.name}",
+            "model": {
+                "type": "minecraft:model",
+                "model": f"tasty_supplies:item/{self.name}",
+            },
+        }
 
     def create_base_item_model(self, ctx: TSContext) -> None:
         """Create the base item model with custom_model_data selection.
@@ -178,46 +249,80 @@ class Item:
             }
         )
 
-    def _setup_sha1_updater(self, ctx: TSContext) -> None:
-        """Setup SHA1 updater functions.
+    def _get_updater_lines(self) -> Dict[str, List[str]]:
+        """Generate the lines appended to the updater functions.
+
+        The current version stamp is set as the `#<name>` score of the
+        `ts_version` objective at load, so checking a stack is a single
+        score comparison.
+
+        Returns:
+            Dict mapping function paths to the lines to append
+        """
+        return {
+            "updater/load_versions": [
+                f"scoreboard players set #{self.name} ts_version {self._to_version()}"
+            ],
+        }
+
+    def _get_updater_modifiers(
+        self, components: Dict[str, Any], removed: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Generate the item modifiers owned by this item.
+
+        `updater/replace_item` applies `tasty_supplies:updater/<name>` to an
+        outdated stack, which turns it into the current version of the item
+        while keeping its count.
 
         Args:
-            ctx: The Tasty Supplies context
+            components: The current components of the item
+            removed: Components of other items this item does not define,
+                they are removed from the stack
+
+        Returns:
+            Dict mapping item modifier paths to their functions
         """
-        sha1_check_func = ctx.data["tasty_supplies"].functions.get("updater/check_sha1")
-        sha1_check_func.append(
-            Function(
-                'execute if data storage tasty_supplies:updater temp{hash: "'
-                + self._to_sha1()
-                + '"} run return 1'
-            )
-        )
+        removals = {f"!{component}": {} for component in removed}
+        return {
+            f"updater/{self.name}": [
+                {
+                    "function": "minecraft:set_item",
+                    "item": f"minecraft:{self.base_item}",
+                },
+                {
+                    "function": "minecraft:set_components",
+                    "components": components | removals,
+                },
+            ],
+        }
 
-        item_replace_func = ctx.data["tasty_supplies"].functions.get(
-            "updater/replace_item"
-        )
-        item_replace_func.append(
-            Function(
-                (
-                    '$execute if data storage tasty_supplies:updater temp{item_name: "'
-                    + self.name
-                    + '"} run item replace $(target) $(path) with '
-                    + to_item_repr(self)
-                    + " $(count)"
-                ),
-                (
-                    '$execute if data storage tasty_supplies:updater temp{item_name: "'
-                    + self.name
-                    + '"} run return 0'
-                ),
-            ),
-        )
+    def _get_removed_components(self, component_names: Iterable[str]) -> List[str]:
+        """Get the components the updater removes from outdated stacks.
+
+        These are the components of other items that this item does not
+        define, so that the stack ends up with exactly the components of the
+        item. Default components of the base item are kept.
+
+        Args:
+            component_names: The components used across the whole catalog
+
+        Returns:
+            The sorted component names
+        """
+        kept = set(self.nbt["components"]) | DEFAULT_COMPONENTS
+        kept |= BASE_ITEM_COMPONENTS.get(self.base_item, frozenset())
+        return sorted(set(component_names) - kept)
 
     def to_result(self, count: int = 1) -> Dict[str, Any]:
         result = self.nbt
         result["count"] = count
         return result
 
+    @property
+    def item_repr(self) -> str:
+        """The `<base_item>[<components>]` representation used in commands."""
+        return self._get_payload().item_repr
+
     def _raw_nbt(self, count: int = 1) -> dict:
         nbt = {
             "id": f"minecraft:{self.base_item}",
@@ -230,9 +335,7 @@ class Item:
 
     @property
     def nbt(self) -> dict:
-        nbt = self._raw_nbt()
-        nbt["components"].setdefault("custom_data", {})["ts_hash"] = self._to_sha1()
-        return nbt
+        return json.loads(self._get_payload().nbt_json)
 
     @property
     def custom_model_data(self) -> dict:
@@ -246,7 +349,7 @@ class Item:
     def predicate(self) -> dict:
         return {
             "items": self.base_item,
-            "components": self.custom_model_data | self.components,
+            "components": copy.deepcopy(self.custom_model_data | self.components),
         }
 
     def entry(
@@ -264,7 +367,9 @@ class Item:
             "functions": [
                 {
                     "function": "minecraft:set_components",
-                    "components": self.custom_model_data | self.components,
+                    "components": copy.deepcopy(
+                        self.custom_model_data | self.components
+                    ),
                 }
             ],
             "weight": int(weight),
@@ -315,7 +420,13 @@ class Item:
         return entry
 
     def _to_sha1(self) -> str:
-        raw_nbt = self._raw_nbt()
+        return self._get_payload().sha1
+
+    def _to_version(self) -> int:
+        return self._get_payload().version
+
+    @staticmethod
+    def _hash_nbt(raw_nbt: dict) -> str:
         canonical = json.dumps(
             raw_nbt,
             sort_keys=True,
@@ -101,6 +101,14 @@ class Recipe:
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    def get_ingredients(self) -> List[IngredientType]:
+        """Get the ingredients of this recipe, in order.
+
+        Returns:
+            List of ingredients (vanilla strings, Item objects or dicts)
+        """
+        return []
+
     def _get_result_json(self) -> Dict[str, Any]:
         """Get the result portion of the recipe JSON.
 
@@ -136,6 +144,9 @@ class ShapelessRecipe(Recipe):
         super().__init__(recipe_id, result, category, result_count)
         self.ingredients: List[IngredientType] = ingredients
 
+    def get_ingredients(self) -> List[IngredientType]:
+        return list(self.ingredients)
+
     def _to_json(self) -> Dict[str, Any]:
         return {
             "type": "minecraft:crafting_shapeless",
@@ -174,6 +185,9 @@ class ShapedRecipe(Recipe):
         self.pattern: List[str] = pattern
         self.key: Dict[str, IngredientType] = key
 
+    def get_ingredients(self) -> List[IngredientType]:
+        return list(self.key.values())
+
     def _to_json(self) -> Dict[str, Any]:
         # Process the key ingredients
         processed_key: Dict[str, Union[str, Dict[str, Any]]] = {}
@@ -224,6 +238,9 @@ class SmeltingRecipe(Recipe):
         self.experience: float = experience
         self.cooking_time: int = cooking_time
 
+    def get_ingredients(self) -> List[IngredientType]:
+        return [self.ingredient]
+
     def _to_json(self) -> Dict[str, Any]:
         recipe_data: Dict[str, Any] = {
             "type": f"minecraft:{self.cooking_type}",
@@ -344,6 +361,9 @@ class SmithingTransformRecipe(Recipe):
         self.base: IngredientType = base
         self.addition: IngredientType = addition
 
+    def get_ingredients(self) -> List[IngredientType]:
+        return [self.template, self.base, self.addition]
+
     def _to_json(self) -> Dict[str, Any]:
         return {
             "type": "minecraft:smithing_transform",
@@ -378,6 +398,9 @@ class CuttingBoardRecipe(Recipe):
         super().__init__(recipe_id, result, "", result_count)
         self.ingredient: IngredientType = ingredient
 
+    def get_ingredients(self) -> List[IngredientType]:
+        return [self.ingredient]
+
     def register(self, ctx: TSContext) -> None:
         """Register this cutting board recipe.
 
@@ -385,9 +408,8 @@ class CuttingBoardRecipe(Recipe):
             ctx: The Tasty Supplies context
         """
         recipe_path: str = f"tasty_supplies:cutting_board/recipes/{self.recipe_id}"
-        result_json: Dict[str, Any] = _process_result(
-            self.result, count=self.result_count
-        )
+        result_json: Dict[str, Any] = self._get_result_json()
+        key: str = self._get_dispatch_key()
 
         # Create the function that spawns the result item
         ctx.data[recipe_path] = Function(
@@ -397,34 +419,37 @@ class CuttingBoardRecipe(Recipe):
             ]
         )
 
-        # Add to the cutting board's main function
-        f_cut_item = ctx.data["tasty_supplies"].functions.get("cutting_board/cut_item")
-
-        # Determine if ingredient is vanilla or custom
-        ingredient_check = self._get_ingredient_check()
-        f_cut_item.append(
+        # Add the dispatch entry to the cutting board recipe map, only set if
+        # an earlier recipe did not already claim the ingredient
+        f_load_recipes = ctx.data["tasty_supplies"].functions.get(
+            "cutting_board/load_recipes"
+        )
+        f_load_recipes.append(
             Function(
-                f"execute if data entity @s item{ingredient_check} run function {recipe_path}"
+                "execute unless data storage tasty_supplies:cutting_board "
+                f'recipes."{key}" run data modify storage '
+                f'tasty_supplies:cutting_board recipes."{key}" '
+                f'set value {{recipe: "{self.recipe_id}"}}'
             )
         )
 
         log.debug(f"Registered cutting board recipe '{self.recipe_id}'")
 
-    def _get_ingredient_check(self) -> str:
-        """Get the NBT check string for the ingredient.
+    def _get_dispatch_key(self) -> str:
+        """Get the key the cutting board dispatches this recipe on.
+
+        Custom ingredients are matched on their `ts_name` custom data and
+        vanilla ingredients on their item id.
 
         Returns:
-            String with the NBT check for /execute if data
+            The item name or absolute item id of the ingredient
         """
         if isinstance(self.ingredient, Item):
-            return (
-                f'{{id: "minecraft:{self.ingredient.base_item}", '
-                f'components: {{"minecraft:custom_model_data": '
-                f'{{"strings": ["tasty_supplies/{self.ingredient.name}"]}}}}}}'
-            )
+            return self.ingredient.name
         elif isinstance(self.ingredient, dict):
-            # Custom dict format - would need more complex handling
-            return str(self.ingredient)
+            return to_absolute_path(
+                self.ingredient.get("item") or self.ingredient.get("id", "")
+            )
         else:
             # Vanilla item
-            return f'{{id: "{to_absolute_path(str(self.ingredient))}"}}'
+            return to_absolute_path(str(self.ingredient))
@@ -0,0 +1,128 @@
+"""Phase-level build profiler for Tasty Supplies.
+
+When enabled, every generation phase records its wall time, CPU time, peak
+memory and the number of live objects, and a JSON report is written next to
+the build output (`tasty_supplies_profile.json`).
+
+Profiling is enabled by setting the `TASTY_SUPPLIES_PROFILE` environment
+variable to `1`, `true`, `yes` or `on` (case-insensitive), or with the
+`tasty_supplies.profile` meta option:
+
+    meta:
+      tasty_supplies:
+        profile: true
+"""
+
+import gc
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from beet import Context
+
+from .logger import log
+
+PROFILE_ENV = "TASTY_SUPPLIES_PROFILE"
+REPORT_NAME = "tasty_supplies_profile.json"
+REPORT_VERSION = 1
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def is_profiling_enabled(ctx: Context) -> bool:
+    """Check whether profiling was requested by environment or meta option."""
+    if os.environ.get(PROFILE_ENV, "").strip().lower() in TRUE_VALUES:
+        return True
+    return bool(ctx.meta.get("tasty_supplies", {}).get("profile", False))
+
+
+class BuildProfiler:
+    """Records resource usage of the build phases.
+
+    Phases are measured one after the other; a disabled profiler does not
+    measure anything and writes no report.
+    """
+
+    def __init__(self, ctx: Context, enabled: bool = False):
+        """Initialize the profiler.
+
+        Args:
+            ctx: The Beet context whose output directory receives the report
+            enabled: When False, phases are not measured
+        """
+        self.enabled = enabled
+        self.phases: List[Dict[str, Any]] = []
+        self._report_dir = Path(ctx.output_directory or ctx.directory)
+        self._started_tracing = False
+
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def phase(self, name: str, category: Optional[str] = None) -> Iterator[None]:
+        """Measure the wrapped block as a build phase.
+
+        Args:
+            name: The phase name (e.g. "create_items")
+            category: The category processed by the phase (optional)
+        """
+        if not self.enabled:
+            yield
+            return
+
+        objects_before = len(gc.get_objects())
+        tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            _, peak_memory = tracemalloc.get_traced_memory()
+            objects_after = len(gc.get_objects())
+
+            self.phases.append(
+                {
+                    "name": name,
+                    "category": category,
+                    "wall_time": round(wall_time, 6),
+                    "cpu_time": round(cpu_time, 6),
+                    "peak_memory": peak_memory,
+                    "objects": objects_after,
+                    "objects_delta": objects_after - objects_before,
+                }
+            )
+
+    def write_report(self) -> Optional[Path]:
+        """Write the JSON report of the recorded phases.
+
+        Returns:
+            The path of the report, or None if profiling is disabled
+        """
+        if not self.enabled:
+            return None
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        report = {
+            "version": REPORT_VERSION,
+            "phases": self.phases,
+            "totals": {
+                "wall_time": round(sum(p["wall_time"] for p in self.phases), 6),
+                "cpu_time": round(sum(p["cpu_time"] for p in self.phases), 6),
+                "peak_memory": max((p["peak_memory"] for p in self.phases), default=0),
+            },
+        }
+
+        path = self._report_dir / REPORT_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=4))
+        log.info(f"Build profile written to {path}")
+        return path
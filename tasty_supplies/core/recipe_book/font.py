@@ -1,11 +1,13 @@
-import os
-from typing import List
-from beet import ResourcePack, Texture
+import hashlib
+import io
+from typing import Dict, List, Optional
+from beet import File, ResourcePack
+from PIL import Image
 
-from ..models import Item, Recipe, TSContext
-
-item_references: dict[str, str] = {}
-item_advances: dict[str, int] = {}
+from ..models import Item, TSContext
+from ..models.recipe import IngredientType
+from ..build_cache import read_file_bytes
+from .index import DEFAULT_ADVANCE, RecipeBookIndex
 
 
 def _get_char(char_idx: int) -> str:
@@ -13,42 +15,103 @@ def _get_char(char_idx: int) -> str:
     return chr(0xE000 + char_idx)
 
 
-def _get_texture_advance(ctx: TSContext, texture_path: str) -> int:
+def _compute_advance(data: bytes) -> int:
     """Calculate the pixel advance of a Minecraft texture font character.
     Minecraft does not crop empty space on the left, but it crops empty space
     on the right and forces exactly 1 pixel of spacing.
     Thus, the advance is the rightmost pixel's x-coordinate + 1.
     """
-    if not texture_path:
-        return 17
-
-    is_vanilla = texture_path.startswith("minecraft:")
-    tex_path_no_ext = texture_path.removesuffix(".png")
-    if is_vanilla:
-        tex = ctx.vanilla.assets.textures.get(tex_path_no_ext)
-    else:
-        tex = ctx.assets.textures.get(tex_path_no_ext)
-
-    advance = 17
-    if tex and hasattr(tex, "image") and tex.image:
-        try:
-            alpha = tex.image.convert("RGBA").split()[-1]
+    advance = DEFAULT_ADVANCE
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            alpha = image.convert("RGBA").split()[-1]
             bbox = alpha.getbbox()
             if bbox:
                 # bbox[2] is the rightmost bounding box edge
                 advance = bbox[2] + 1
-        except Exception:
-            pass
+    except Exception:
+        pass
 
     return advance
 
 
+def _compute_advances(textures: Dict[str, bytes]) -> Dict[str, int]:
+    """Compute the advances of the given textures, keyed by content hash."""
+    return {digest: _compute_advance(data) for digest, data in textures.items()}
+
+
+def _get_texture(ctx: TSContext, texture_path: str) -> Optional[File]:
+    is_vanilla = texture_path.startswith("minecraft:")
+    tex_path_no_ext = texture_path.removesuffix(".png")
+    if is_vanilla:
+        return ctx.vanilla.assets.textures.get(tex_path_no_ext)
+    return ctx.assets.textures.get(tex_path_no_ext)
+
+
+def _get_texture_advances(
+    ctx: TSContext, texture_paths: Dict[str, Optional[str]]
+) -> Dict[str, int]:
+    """Get the advances of the given textures, keyed by character name.
+
+    Advances are cached by texture content hash in the build cache, so only
+    new or modified textures are decoded.
+    """
+    advances: Dict[str, int] = {}
+    digests: Dict[str, str] = {}
+    pending: Dict[str, bytes] = {}
+
+    for name, texture_path in texture_paths.items():
+        tex = _get_texture(ctx, texture_path) if texture_path else None
+        if tex is None:
+            advances[name] = DEFAULT_ADVANCE
+            continue
+
+        data = read_file_bytes(tex)
+        digest = hashlib.sha1(data).hexdigest()
+        cached = ctx.build_cache.get("glyph_advances", digest, digest)
+        if cached is not None:
+            advances[name] = cached
+        else:
+            digests[name] = digest
+            pending[digest] = data
+
+    computed = _compute_advances(pending)
+    for digest, advance in computed.items():
+        ctx.build_cache.set("glyph_advances", digest, digest, advance)
+    for name, digest in digests.items():
+        advances[name] = computed[digest]
+
+    return advances
+
+
 def get_providers(
-    ctx: TSContext, recipe_references: dict[Item, List[Recipe]]
-) -> List[dict]:
+    ctx: TSContext, index: RecipeBookIndex, ingredients: List[IngredientType]
+) -> dict:
+    """Build the recipe book font and fill the font tables of the index.
+
+    The advances are read through the glyph cache, so only new or edited
+    textures are decoded.
+    """
+    font = _build_providers(ctx, index, ingredients)
+
+    index.item_references.update(font["item_references"])
+    index.item_advances.update(_get_texture_advances(ctx, font["texture_paths"]))
+
+    ctx.build_cache.prune()
+    ctx.build_cache.log_summary()
+
+    return {"providers": font["providers"]}
+
+
+def _build_providers(
+    ctx: TSContext, index: RecipeBookIndex, ingredients: List[IngredientType]
+) -> dict:
+    item_references: Dict[str, str] = {}
     providers: List[dict] = []
     char_idx: int = 0
     space_advances = {}
+    # Textures whose advance is still unknown, keyed by character name
+    texture_paths: Dict[str, Optional[str]] = {}
 
     for i in range(1, 101):
         space_advances[chr(0xF000 + i)] = -i
@@ -57,12 +120,12 @@ def get_providers(
     providers.append({"type": "space", "advances": space_advances})
 
     # Grids
-    providers.append(_register_grid("grid_cooking", chr(0xE901)))
-    providers.append(_register_grid("grid_crafting", chr(0xE902)))
-    providers.append(_register_grid("grid_cutting", chr(0xE903)))
+    providers.append(_register_grid(item_references, "grid_cooking", chr(0xE901)))
+    providers.append(_register_grid(item_references, "grid_crafting", chr(0xE902)))
+    providers.append(_register_grid(item_references, "grid_cutting", chr(0xE903)))
 
     # Result textures
-    for item in recipe_references.keys():
+    for item in index.recipe_references.keys():
         if item.name not in item_references:
             texture_path = f"{item.texture_path}.png"
             provider: dict = {
@@ -75,63 +138,52 @@ def get_providers(
             providers.append(provider)
             item_references[item.name] = _get_char(char_idx)
 
-            item_advances[item.name] = _get_texture_advance(ctx, texture_path)
+            texture_paths[item.name] = texture_path
 
             char_idx += 1
 
     vanilla_assets: ResourcePack = ctx.vanilla.assets
 
     # Ingredient textures
-    recipes: list[Recipe] = [
-        r for sublist in recipe_references.values() for r in sublist
-    ]
-    for recipe in recipes:
-        ing_items = []
-        if hasattr(recipe, "ingredient") and recipe.ingredient:
-            ing_items.append(recipe.ingredient)
-        if hasattr(recipe, "ingredients") and recipe.ingredients:
-            if isinstance(recipe.ingredients, list):
-                ing_items.extend(recipe.ingredients)
-            elif isinstance(recipe.ingredients, dict):
-                ing_items.extend(recipe.ingredients.values())
-        if hasattr(recipe, "key") and recipe.key:
-            ing_items.extend(recipe.key.values())
-
-        for ing in ing_items:
-            # ing can be a string (vanilla), an Item (custom) or a dict.
-            item_name = None
-            texture_path = None
-
-            if isinstance(ing, Item):
-                item_name = ing.name
-                texture_path = ing.texture_path + ".png"
-            elif isinstance(ing, str) and not ing.startswith("#"):
-                # Vanilla item
-                item_name = ing.removeprefix("minecraft:")
-                if vanilla_assets.textures.get(f"minecraft:item/{item_name}"):
-                    texture_path = f"minecraft:item/{item_name}.png"
-
-                # TODO support non-item textures
-
-            if item_name and item_name not in item_advances:
-                item_advances[item_name] = _get_texture_advance(ctx, texture_path)
-
-            if item_name and texture_path and item_name not in item_references:
-                provider = {
-                    "type": "bitmap",
-                    "file": texture_path,
-                    "height": 16,
-                    "ascent": 16,
-                    "chars": [_get_char(char_idx)],
-                }
-                providers.append(provider)
-                item_references[item_name] = _get_char(char_idx)
-                char_idx += 1
-
-    return {"providers": providers}
-
-
-def _register_grid(grid_name: str, char: str) -> dict:
+    for ing in ingredients:
+        # ing can be a string (vanilla), an Item (custom) or a dict.
+        item_name = None
+        texture_path = None
+
+        if isinstance(ing, Item):
+            item_name = ing.name
+            texture_path = ing.texture_path + ".png"
+        elif isinstance(ing, str) and not ing.startswith("#"):
+            # Vanilla item
+            item_name = ing.removeprefix("minecraft:")
+            if vanilla_assets.textures.get(f"minecraft:item/{item_name}"):
+                texture_path = f"minecraft:item/{item_name}.png"
+
+            # TODO support non-item textures
+
+        if item_name and item_name not in texture_paths:
+            texture_paths[item_name] = texture_path
+
+        if item_name and texture_path and item_name not in item_references:
+            provider = {
+                "type": "bitmap",
+                "file": texture_path,
+                "height": 16,
+                "ascent": 16,
+                "chars": [_get_char(char_idx)],
+            }
+            providers.append(provider)
+            item_references[item_name] = _get_char(char_idx)
+            char_idx += 1
+
+    return {
+        "providers": providers,
+        "item_references": item_references,
+        "texture_paths": texture_paths,
+    }
+
+
+def _register_grid(item_references: Dict[str, str], grid_name: str, char: str) -> dict:
     item_references[grid_name] = char
 
     provider = {
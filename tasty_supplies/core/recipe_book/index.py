@@ -0,0 +1,54 @@
+"""Per-build lookup tables of the recipe book.
+
+The recipe book needs to know which recipes produce each item, which font
+character displays each item and how wide each of these characters is. These
+tables live on a RecipeBookIndex created for every build, so repeated builds
+in the same process (e.g. `beet watch`) start from a clean state.
+"""
+
+from typing import Dict, List
+
+from ..bucket import Bucket
+from ..models import Item, Recipe, TSContext
+
+DEFAULT_ADVANCE = 17
+
+
+class RecipeBookIndex:
+    """Lookup tables shared by the recipe book font and pages.
+
+    Attributes:
+        recipe_references: Recipes grouped by the item they produce
+        item_references: Font character of each item (and grid) by name
+        item_advances: Pixel advance of each item character by name
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.recipe_references: Dict[Item, List[Recipe]] = {}
+        self.item_references: Dict[str, str] = {}
+        self.item_advances: Dict[str, int] = {}
+
+    @classmethod
+    def from_bucket(cls, bucket: Bucket) -> "RecipeBookIndex":
+        """Create an index holding the recipes of the bucket.
+
+        Args:
+            bucket: The bucket containing all recipes
+
+        Returns:
+            A new index whose font tables are still empty
+        """
+        index = cls()
+        for recipes in bucket.export_recipes_by_result().values():
+            result: Item = recipes[0].result
+            index.recipe_references.setdefault(result, []).extend(recipes)
+        return index
+
+    def get_char(self, name: str, default: str = "") -> str:
+        """Get the font character of an item or grid."""
+        return self.item_references.get(name, default)
+
+    def get_advance(self, name: str) -> int:
+        """Get the pixel advance of an item character."""
+        return self.item_advances.get(name, DEFAULT_ADVANCE)
@@ -1,30 +1,19 @@
 import os
-from typing import List
 from beet import Font, Texture
 
-from ..models import TSContext, Item, Recipe, ShapelessRecipe, Rarity
+from ..models import TSContext, Item, ShapelessRecipe, Rarity
 from ..bucket import Bucket
-from .font import get_providers, item_references
+from .font import get_providers
+from .index import RecipeBookIndex
 from .pages import generate_pages
 
-recipe_references: dict[Item, List[Recipe]] = {}
-
-
-def _retrieve_recipes(bucket: Bucket) -> None:
-    for recipe in bucket.get_all_recipes():
-        result: Item = recipe.result
-
-        if not result in recipe_references.keys():
-            recipe_references[result] = []
-        recipe_references[result].append(recipe)
-
 
 def generate(ctx: TSContext, bucket: Bucket) -> None:
-    _retrieve_recipes(bucket)
-    font_data = get_providers(ctx, recipe_references)
+    index = RecipeBookIndex.from_bucket(bucket)
+    font_data = get_providers(ctx, index, bucket.export_ingredients())
     ctx.assets["tasty_supplies"].fonts["recipe_book"] = Font(font_data)
 
-    pages = generate_pages(bucket, recipe_references, item_references)
+    pages = generate_pages(bucket, index)
 
     book_item = Item(
         "cookbook",
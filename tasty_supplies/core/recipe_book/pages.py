@@ -1,4 +1,6 @@
+import functools
 import os
+import struct
 from dataclasses import dataclass
 from typing import Dict, List, Union
 
@@ -9,19 +11,21 @@ from ..models import (
     CuttingBoardRecipe,
 )
 from ..bucket import Bucket
+from .index import RecipeBookIndex
 from PIL import ImageFont
 
 PAGE_WIDTH = 114
 TITLE_MAX_LINES = 3
 
-FONT_BOLD = ImageFont.truetype(
-    os.path.join(os.path.dirname(__file__), "../../src/assets/minecraft/font/stwb.ttf"),
-    size=9,
-)
-FONT_REGULAR = ImageFont.truetype(
-    os.path.join(os.path.dirname(__file__), "../../src/assets/minecraft/font/stwb.ttf"),
-    size=9,
+FONT_FILE = os.path.join(
+    os.path.dirname(__file__), "../../src/assets/minecraft/font/stwb.ttf"
 )
+FONT_SIZE = 9
+FONT = ImageFont.truetype(FONT_FILE, size=FONT_SIZE)
+
+# Characters measured up front when building a glyph width table
+PRECOMPUTED_CHARS = "".join(chr(i) for i in range(0x20, 0x7F))
+KERNING_TABLES = (b"kern", b"GPOS")
 
 SUM_ITEMS_PER_LINE = 7
 SUM_MAX_ITEM_PER_PAGES = 35
@@ -53,11 +57,67 @@ _SLOT_POS: dict[str, tuple[int, int]] = {
 }
 
 
-def get_text_width(text: str, font: ImageFont.FreeTypeFont = FONT_REGULAR) -> int:
-    return int(font.getlength(text)) if text else 0
+def _has_kerning(font_path: str) -> bool:
+    """Check whether a TrueType font has a kerning or positioning table."""
+    with open(font_path, "rb") as f:
+        header = f.read(12)
+        num_tables = struct.unpack(">H", header[4:6])[0]
+        records = f.read(16 * num_tables)
+    tags = {records[i : i + 4] for i in range(0, len(records), 16)}
+    return any(tag in tags for tag in KERNING_TABLES)
+
+
+class GlyphWidthTable:
+    """Glyph advances of a font, measured once per character.
+
+    Text width is the sum of the advances of its characters. Pair kerning is
+    only measured when the font has a kerning table, and each pair is only
+    measured once.
+    """
+
+    def __init__(self, font: ImageFont.FreeTypeFont):
+        self.font = font
+        self.has_kerning = _has_kerning(font.path)
+        self._advances: Dict[str, float] = {
+            char: font.getlength(char) for char in PRECOMPUTED_CHARS
+        }
+        self._kerning: Dict[str, float] = {}
+
+    def get_advance(self, char: str) -> float:
+        advance = self._advances.get(char)
+        if advance is None:
+            advance = self._advances[char] = self.font.getlength(char)
+        return advance
+
+    def get_kerning(self, pair: str) -> float:
+        kerning = self._kerning.get(pair)
+        if kerning is None:
+            kerning = self._kerning[pair] = (
+                self.font.getlength(pair)
+                - self.get_advance(pair[0])
+                - self.get_advance(pair[1])
+            )
+        return kerning
+
+    def get_length(self, text: str) -> float:
+        length = sum(self.get_advance(char) for char in text)
+        if self.has_kerning:
+            length += sum(
+                self.get_kerning(text[i : i + 2]) for i in range(len(text) - 1)
+            )
+        return length
+
+
+@functools.lru_cache(maxsize=None)
+def get_width_table(font: ImageFont.FreeTypeFont) -> GlyphWidthTable:
+    return GlyphWidthTable(font)
+
 
+def get_text_width(text: str, font: ImageFont.FreeTypeFont = FONT) -> int:
+    return int(get_width_table(font).get_length(text)) if text else 0
 
-def wrap_line(text: str, font: ImageFont.FreeTypeFont = FONT_REGULAR) -> list[str]:
+
+def wrap_line(text: str, font: ImageFont.FreeTypeFont = FONT) -> list[str]:
     words = text.split()
     lines: list[str] = []
     current = ""
@@ -74,7 +134,8 @@ def wrap_line(text: str, font: ImageFont.FreeTypeFont = FONT_REGULAR) -> list[st
     return lines or [""]
 
 
-def center_line(line: str, font: ImageFont.FreeTypeFont = FONT_REGULAR) -> str:
+@functools.lru_cache(maxsize=None)
+def center_line(line: str, font: ImageFont.FreeTypeFont = FONT) -> str:
     line = line.strip()
     text_width = get_text_width(line, font)
     if text_width >= PAGE_WIDTH:
@@ -84,10 +145,13 @@ def center_line(line: str, font: ImageFont.FreeTypeFont = FONT_REGULAR) -> str:
     return " " * num_spaces + line
 
 
-def wrap_and_center(
-    text: str, font: ImageFont.FreeTypeFont = FONT_REGULAR
-) -> list[str]:
-    return [center_line(line, font) for line in wrap_line(text, font)]
+def wrap_and_center(text: str, font: ImageFont.FreeTypeFont = FONT) -> list[str]:
+    return list(_wrap_and_center(text, font))
+
+
+@functools.lru_cache(maxsize=None)
+def _wrap_and_center(text: str, font: ImageFont.FreeTypeFont) -> tuple[str, ...]:
+    return tuple(center_line(line, font) for line in wrap_line(text, font))
 
 
 def _get_spaces(pixels: int) -> str:
@@ -245,19 +309,17 @@ def _build_grid_row(
     r: int,
     grid: list[list],
     config: GridConfig,
-    item_references: dict[str, str],
+    index: RecipeBookIndex,
     item_page_map: dict[str, int],
     result_item: Item,
     result_char: str,
     grid_char: str,
 ) -> list[dict]:
-    from .font import item_advances
-
     components: list[dict] = []
     cursor_x = 0
 
     for c, target_x in enumerate(iterable=config.cols):
-        char, item_id = _resolve_ingredient(grid[r][c], item_references)
+        char, item_id = _resolve_ingredient(grid[r][c], index.item_references)
         if not char:
             continue
 
@@ -266,7 +328,7 @@ def _build_grid_row(
             if isinstance(item_id, Item)
             else item_id.removeprefix("minecraft:")
         )
-        advance = item_advances.get(name, 17)
+        advance = index.get_advance(name)
 
         components.append(
             {
@@ -279,7 +341,7 @@ def _build_grid_row(
 
     if r == config.result_row:
         name = result_item.name
-        advance = item_advances.get(name, 17)
+        advance = index.get_advance(name)
 
         components.append(
             {
@@ -294,7 +356,7 @@ def _build_grid_row(
 
 def _generate_page(
     recipe,
-    item_references: dict[str, str],
+    index: RecipeBookIndex,
     recipe_index: int = 1,
     total_recipes: int = 1,
     item_page_map: dict[str, int] | None = None,
@@ -308,15 +370,15 @@ def _generate_page(
     if total_recipes > 1:
         display_title += f" ({recipe_index}/{total_recipes})"
 
-    title_lines = wrap_and_center(display_title, FONT_BOLD)
+    title_lines = wrap_and_center(display_title)
     for line in title_lines:
         text_components.append({"text": line + "\n", "font": "minecraft:stwb"})
     for _ in range(TITLE_MAX_LINES - len(title_lines)):
         text_components.append({"text": "\n"})
 
     grid, config = _build_grid_matrix(recipe)
-    grid_char = item_references.get(config.grid_key, "")
-    result_char = item_references.get(recipe.result.name, "<?>")
+    grid_char = index.get_char(config.grid_key)
+    result_char = index.get_char(recipe.result.name, "<?>")
 
     text_components.append(
         {"text": grid_char, "font": "tasty_supplies:recipe_book", "color": "white"}
@@ -328,7 +390,7 @@ def _generate_page(
             r,
             grid,
             config,
-            item_references,
+            index,
             item_page_map,
             recipe.result,
             result_char,
@@ -364,16 +426,10 @@ def _deduplicate_recipes(recipes: list) -> list:
 
 
 def _get_unique_recipes_by_category(bucket: Bucket) -> Dict[str, List[str]]:
-    categories: Dict[str, List[str]] = {}
-    for recipe in bucket.get_all_recipes():
-        category: str = recipe.ts_category
-        if category not in categories:
-            categories[category] = []
-
-        result: str = recipe.result.name
-        if result not in categories[category]:
-            categories[category].append(result)
-    return categories
+    return {
+        category: bucket.get_results_by_category(category)
+        for category in bucket.get_recipe_categories()
+    }
 
 
 def _generate_cover_page() -> dict:
@@ -387,7 +443,7 @@ def _generate_cover_page() -> dict:
             "color": "red",
         }
     )
-    for line in wrap_and_center("Tasty Supplies Cookbook", FONT_BOLD):
+    for line in wrap_and_center("Tasty Supplies Cookbook"):
         extra.append({"text": line + "\n", "font": "minecraft:stwb", "color": "gold"})
     extra.append({"text": "\n\n\n"})  # Margin
     for line in wrap_and_center("Recipes & Guides"):
@@ -400,7 +456,7 @@ def _generate_cover_page() -> dict:
 def _generate_sum_pages(
     bucket: Bucket,
     items: list[Item],
-    item_references: dict[str, str],
+    index: RecipeBookIndex,
     item_page_map: dict[str, int],
 ) -> list[dict]:
     pages = []
@@ -422,7 +478,7 @@ def _generate_sum_pages(
         ]
         extra = []
 
-        for line in wrap_and_center(category.title(), FONT_BOLD):
+        for line in wrap_and_center(category.title()):
             extra.append({"text": line, "font": "minecraft:stwb"})
         extra.append({"text": "\n\n\n\n"})  # Margin
 
@@ -430,7 +486,7 @@ def _generate_sum_pages(
         for item in page_items:
             y += 1
             target_page = item_page_map.get(item.name, 1)
-            icon_char = item_references.get(item.name, "")
+            icon_char = index.get_char(item.name)
 
             click_ev = {"action": "change_page", "page": target_page}
             hover_ev = {
@@ -459,12 +515,11 @@ def _generate_sum_pages(
 
 def generate_pages(
     bucket: Bucket,
-    recipe_references: dict[Item, list],
-    item_references: dict[str, str],
+    index: RecipeBookIndex,
 ) -> list[dict]:
     filtered_refs = {
         item: _deduplicate_recipes(recipes)
-        for item, recipes in recipe_references.items()
+        for item, recipes in index.recipe_references.items()
         if recipes
     }
 
@@ -483,16 +538,12 @@ def generate_pages(
 
     pages = []
     pages.append(_generate_cover_page())
-    pages.extend(
-        _generate_sum_pages(bucket, items_list, item_references, item_page_map)
-    )
+    pages.extend(_generate_sum_pages(bucket, items_list, index, item_page_map))
 
     for item, recipes in filtered_refs.items():
         for i, recipe in enumerate(recipes):
             pages.append(
-                _generate_page(
-                    recipe, item_references, i + 1, len(recipes), item_page_map
-                )
+                _generate_page(recipe, index, i + 1, len(recipes), item_page_map)
             )
 
     return pages
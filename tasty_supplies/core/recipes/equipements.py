@@ -1,8 +1,4 @@
-from logging import log
-from beet import ItemModel
-
 from core import (
-    TSContext,
     Item,
     ShapedRecipe,
     Category,
@@ -43,56 +39,34 @@ class EquipementItem(Item):
             case "feet":  # Useless
                 return "leather_boots"
 
-    def _register_model_case(self, ctx: TSContext) -> ItemModel:
-        """Generate the item_model JSON.
+    def _get_model_case(self) -> dict:
+        """Generate the custom model data case for this equipement.
+
+        The equipement model is used when worn, the item model otherwise.
 
         Returns:
-            ItemModel: The Beet ItemModel object for this item
+            Dict with the case to add to the base item model
         """
-
-        item_models: dict = ctx.assets["minecraft"].item_models
-        if item_models.get(self.base_item) is None:
-            self.create_base_item_model(ctx)
-
-        item_model: dict = ctx.assets["minecraft"].item_models[self.base_item].data
-
-        if item_model["model"].get("cases") is None:
-            raise ValueError(f"Item model cases not found for {self.base_item}.")
-
-        model_path = f"tasty_supplies:item/{self.name}"
-        for candidate in item_model["model"]["cases"]:
-            if (
-                "model" in candidate["model"]
-                and candidate["model"]["model"] == model_path
-            ):
-                log.warning(
-                    f"Item model case for {self.name} already exists in "
-                    f"minecraft:items/{self.base_item}. Skipping model registration."
-                )
-                return
-
-        item_model["model"]["cases"].append(
-            {
-                "when": f"tasty_supplies/{self.name}",
-                "model": {
-                    "type": "minecraft:select",
-                    "property": "minecraft:display_context",
-                    "cases": [
-                        {
-                            "when": self.slot,
-                            "model": {
-                                "type": "minecraft:model",
-                                "model": f"tasty_supplies:item/equipement/{self.name}",
-                            },
-                        }
-                    ],
-                    "fallback": {
-                        "type": "minecraft:model",
-                        "model": f"tasty_supplies:item/{self.name}",
-                    },
+        return {
+            "when": f"tasty_supplies/{self.name}",
+            "model": {
+                "type": "minecraft:select",
+                "property": "minecraft:display_context",
+                "cases": [
+                    {
+                        "when": self.slot,
+                        "model": {
+                            "type": "minecraft:model",
+                            "model": f"tasty_supplies:item/equipement/{self.name}",
+                        },
+                    }
+                ],
+                "fallback": {
+                    "type": "minecraft:model",
+                    "model": f"tasty_supplies:item/{self.name}",
                 },
-            }
-        )
+            },
+        }
 
 
 class Equipements(Category):
@@ -82,8 +82,17 @@ def to_item_repr(item) -> str:
     Returns:
         <base_item>[<snbt_components>]
     """
+    return item.item_repr
 
-    item_data: Dict[str, Any] = item.to_result()
+
+def format_item_repr(item_data: Dict[str, Any]) -> str:
+    """Format item data as an item representation for Minecraft commands.
+
+    Args:
+        item_data: The item data, as returned by Item.to_result
+    Returns:
+        <base_item>[<snbt_components>]
+    """
     base_item: str = item_data["id"]
     components: Dict[str, Any] = item_data.get("components", {})
     components = remove_minecraft_namespace(components)
@@ -110,3 +119,16 @@ def to_item_repr(item) -> str:
     result: str = f"{base_item}[{escaped}]"
 
     return result
+
+
+def to_version_stamp(sha1: str) -> int:
+    """Truncate a hash to a positive 31-bit int that fits in a score.
+
+    0 is reserved for stacks without a version stamp.
+
+    Args:
+        sha1: The hexadecimal hash
+    Returns:
+        The version stamp
+    """
+    return (int(sha1[:8], 16) >> 1) or 1
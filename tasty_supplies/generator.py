@@ -32,23 +32,46 @@ def generate(ctx: TSContext) -> None:
         Worksation(bucket),
     ]
 
-    for category in categories:
-        category.create_items()
+    profiler = ctx.profiler
 
-    for category in categories:
-        category.create_recipes()
+    # The report is written (and memory tracing stopped) even if a phase fails
+    try:
+        for category in categories:
+            with profiler.phase("create_items", type(category).__name__):
+                category.create_items()
 
-    recipe_book.generate(ctx, bucket)
+        with profiler.phase("freeze_items"):
+            bucket.freeze_items()
 
-    bucket.register_all(ctx)
-    convert_data(ctx, bucket)
+        for category in categories:
+            with profiler.phase("create_recipes", type(category).__name__):
+                category.create_recipes()
 
-    # TODO: Why is this here?
-    cutting_board = bucket.get("cutting_board")
-    if cutting_board:
-        ctx.data["tasty_supplies:cutting_board/drop"] = Function(
-            [f"summon minecraft:item ~ ~.5 ~ {{Item:{cutting_board.to_result()}}}"]
-        )
+        with profiler.phase("recipe_book"):
+            recipe_book.generate(ctx, bucket)
+
+        with profiler.phase("register_all"):
+            bucket.register_all(ctx)
+            pack_version = ctx.hash_manifest.get_pack_version()
+            ctx.data["tasty_supplies"].functions.get("updater/load_versions").append(
+                Function([f"scoreboard players set #pack ts_version {pack_version}"])
+            )
+
+        with profiler.phase("convert_data"):
+            convert_data(ctx, bucket)
+
+        # TODO: Why is this here?
+        with profiler.phase("cutting_board_drop"):
+            cutting_board = bucket.get("cutting_board")
+            if cutting_board:
+                drop_item = cutting_board.to_result()
+                ctx.data["tasty_supplies:cutting_board/drop"] = Function(
+                    [f"summon minecraft:item ~ ~.5 ~ {{Item:{drop_item}}}"]
+                )
+
+        ctx.hash_manifest.write()
+    finally:
+        profiler.write_report()
 
     item_count = len(bucket.export_item_names())
     recipe_count = len(bucket.export_recipe_ids())
@@ -4,9 +4,7 @@ This module provides the build_pack function that is called by Beet
 to generate the complete datapack.
 """
 
-import json
-from typing import Dict, Any
-from beet import PngFile, Context, Model, ItemModel
+from beet import PngFile, Context
 
 from core import TSContext
 from generator import generate
@@ -2,7 +2,7 @@
 ## @s => must be a player
 ## @pos => must be the interaction
 
-execute as @e[type=minecraft:interaction, distance=..1, limit=1, sort=nearest] if data entity @s {Tags:["cutting_board_interaction"]} run data remove entity @s attack
+execute as @e[type=minecraft:interaction, tag=cutting_board_interaction, distance=..1, limit=1, sort=nearest] run data remove entity @s attack
 
 # If the cutting board is attacked with a knife run the cut_item function with the item_display of the cutting board item
 execute if data entity @s SelectedItem.components."minecraft:custom_data".ts_cutting_tool if data entity @s SelectedItem.components.minecraft:custom_model_data positioned ~ ~0.078125 ~-0.125 as @e[type=item_display, distance=..1, sort=nearest] at @s run return run function tasty_supplies:cutting_board/cut_item
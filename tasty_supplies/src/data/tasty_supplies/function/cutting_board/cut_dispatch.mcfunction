@@ -0,0 +1,6 @@
+## Requirements
+## @s => the item_display of the cutting board item
+## $ => the dispatch key (custom item name or item id)
+
+$execute unless data storage tasty_supplies:cutting_board recipes."$(key)" run return fail
+$function tasty_supplies:cutting_board/cut_recipe with storage tasty_supplies:cutting_board recipes."$(key)"
\ No newline at end of file
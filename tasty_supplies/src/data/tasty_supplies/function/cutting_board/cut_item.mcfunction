@@ -1,2 +1,7 @@
 execute if data entity @s item.components."minecraft:custom_data"{tags:["cutting_board_display"]} run return 0
-# Auto-generated
+
+# Dispatch on the custom item name, or on the item id for vanilla items
+data remove storage tasty_supplies:cutting_board temp
+data modify storage tasty_supplies:cutting_board temp.key set from entity @s item.id
+data modify storage tasty_supplies:cutting_board temp.key set from entity @s item.components."minecraft:custom_data".ts_name
+function tasty_supplies:cutting_board/cut_dispatch with storage tasty_supplies:cutting_board temp
\ No newline at end of file
@@ -0,0 +1 @@
+$function tasty_supplies:cutting_board/recipes/$(recipe)
\ No newline at end of file
@@ -0,0 +1,4 @@
+## Requirements
+## @s => must be a cutting board interaction
+
+return run execute on target if entity @s[tag=ts_cutting_board_user]
\ No newline at end of file
@@ -0,0 +1 @@
+data remove storage tasty_supplies:cutting_board recipes
\ No newline at end of file
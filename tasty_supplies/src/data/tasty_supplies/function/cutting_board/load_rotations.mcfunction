@@ -0,0 +1 @@
+data modify storage tasty_supplies:cutting_board rotations set value {"45": [90.0f, 0.0f], "-45": [-90.0f, 0.0f], "135": [180.0f, 0.0f], "-135": [-180.0f, 0.0f]}
\ No newline at end of file
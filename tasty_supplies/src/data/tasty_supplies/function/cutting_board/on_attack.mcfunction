@@ -0,0 +1,6 @@
+## Requirements
+## @s => must be the player who attacked a cutting board
+
+tag @s add ts_cutting_board_user
+execute as @e[type=minecraft:interaction, tag=cutting_board_interaction, distance=..16] at @s if data entity @s attack.player on attacker if entity @s[tag=ts_cutting_board_user] run function tasty_supplies:cutting_board/attack
+tag @s remove ts_cutting_board_user
\ No newline at end of file
@@ -0,0 +1,6 @@
+## Requirements
+## @s => must be the player who interacted with a cutting board
+
+tag @s add ts_cutting_board_user
+execute as @e[type=minecraft:interaction, tag=cutting_board_interaction, distance=..16] if data entity @s interaction.player if function tasty_supplies:cutting_board/is_user run function tasty_supplies:cutting_board/interact
+tag @s remove ts_cutting_board_user
\ No newline at end of file
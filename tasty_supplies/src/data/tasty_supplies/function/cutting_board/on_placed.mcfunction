@@ -0,0 +1,9 @@
+## Requirements
+## @s => must be the cutting board placer
+## @pos => must be the cutting board placer
+
+# Snap diagonal rotations to the next right angle
+execute store result storage tasty_supplies:cutting_board temp.yaw int 1 run data get entity @s Rotation[0]
+function tasty_supplies:cutting_board/snap_rotation with storage tasty_supplies:cutting_board temp
+
+function tasty_supplies:cutting_board/place with entity @s
\ No newline at end of file
@@ -0,0 +1 @@
+$data modify entity @s Rotation set from storage tasty_supplies:cutting_board rotations."$(yaw)"
\ No newline at end of file
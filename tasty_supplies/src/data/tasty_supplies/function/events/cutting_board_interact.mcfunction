@@ -0,0 +1,3 @@
+function tasty_supplies:cutting_board/on_interact
+
+advancement revoke @s only tasty_supplies:technical/_on_cutting_board_interact
\ No newline at end of file
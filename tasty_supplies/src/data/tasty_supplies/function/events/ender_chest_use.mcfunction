@@ -0,0 +1,3 @@
+function tasty_supplies:updater/on_ender_chest_use
+
+advancement revoke @s only tasty_supplies:technical/_on_ender_chest_use
\ No newline at end of file
@@ -1,7 +1,12 @@
 scoreboard objectives add disable_update dummy
 execute unless score #ts_settings disable_update matches 1.. run scoreboard players set #ts_settings disable_update 0
+scoreboard objectives add scan_budget dummy
+execute unless score #ts_settings scan_budget matches 1.. run scoreboard players set #ts_settings scan_budget 16
 
 function tasty_supplies:events/on_load
+function tasty_supplies:updater/load_versions
+function tasty_supplies:cutting_board/load_rotations
+function tasty_supplies:cutting_board/load_recipes
 execute if score #ts_settings disable_update matches ..0 run function tasty_supplies:updater/on_load
 
 function tasty_supplies:tick_20
\ No newline at end of file
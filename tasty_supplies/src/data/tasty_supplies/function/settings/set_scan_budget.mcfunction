@@ -0,0 +1,6 @@
+# Usage: function tasty_supplies:settings/set_scan_budget {budget: <entities checked per tick>}
+
+$scoreboard players set #ts_settings scan_budget $(budget)
+execute if score #ts_settings scan_budget matches ..0 run scoreboard players set #ts_settings scan_budget 1
+
+tellraw @s ["§6§l[Tasty Supplies] §r§7Updater now checks ", {"score": {"name": "#ts_settings", "objective": "scan_budget"}, "color": "gray"}, "§7 queued entities per tick."]
\ No newline at end of file
@@ -0,0 +1,5 @@
+## Requirements
+## @s => an item entity not checked yet
+
+tag @s add ts_checked
+function tasty_supplies:updater/check/item {data_path:"Item", item_path:"contents", target:"entity @s"}
\ No newline at end of file
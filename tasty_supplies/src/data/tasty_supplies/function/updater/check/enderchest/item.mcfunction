@@ -1 +1 @@
-$execute as @s run function tasty_supplies:updater/check/item {data_path:"EnderItems[$(SlotsLoopIndex)]", item_path:"enderchest.$(SlotsCurrentIndex)", target:"entity @s"}
\ No newline at end of file
+$execute as @s run function tasty_supplies:updater/check/item {data_path:"EnderItems[{Slot:$(SlotsCurrentIndex)b}]", item_path:"enderchest.$(SlotsCurrentIndex)", target:"entity @s"}
\ No newline at end of file
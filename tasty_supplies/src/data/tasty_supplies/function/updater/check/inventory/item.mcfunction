@@ -1 +1 @@
-$execute as @s run function tasty_supplies:updater/check/item {data_path:"Inventory[$(SlotsLoopIndex)]", item_path:"$(SlotsName).$(SlotsContainerIndex)", target:"entity @s"}
\ No newline at end of file
+$execute as @s run function tasty_supplies:updater/check/item {data_path:"Inventory[{Slot:$(SlotsCurrentIndex)b}]", item_path:"$(SlotsName).$(SlotsContainerIndex)", target:"entity @s"}
\ No newline at end of file
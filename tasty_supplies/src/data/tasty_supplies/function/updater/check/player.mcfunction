@@ -0,0 +1,14 @@
+## Requirements
+## @s => a player
+
+# The inventory is always checked, the fast path skips it when it holds no
+# custom item
+function tasty_supplies:updater/check/inventory/main
+
+# Ender chest and equipment are only scanned once per pack version, their
+# stacks come from the inventory or are checked when an ender chest is opened
+execute if score @s ts_scanned = #pack ts_version run return fail
+
+function tasty_supplies:updater/check/enderchest/main
+function tasty_supplies:updater/check/equipment
+scoreboard players operation @s ts_scanned = #pack ts_version
\ No newline at end of file
@@ -1 +1 @@
-$execute positioned ~ ~ ~ run function tasty_supplies:updater/check/item {data_path:"Items[$(SlotsLoopIndex)]", item_path:"container.$(SlotsCurrentIndex)", target:"block ~ ~ ~"}
\ No newline at end of file
+$execute positioned ~ ~ ~ run function tasty_supplies:updater/check/item {data_path:"Items[{Slot:$(SlotsCurrentIndex)b}]", item_path:"container.$(SlotsCurrentIndex)", target:"block ~ ~ ~"}
\ No newline at end of file
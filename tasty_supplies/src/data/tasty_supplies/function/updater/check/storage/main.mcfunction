@@ -1,3 +1,7 @@
-scoreboard players set @s ts_loop_index 0
-data modify storage tasty_supplies:updater SlotsTemp set from block ~ ~ ~ Items
-function tasty_supplies:updater/check/storage/loop with storage tasty_supplies:updater SlotsTemp[0]
\ No newline at end of file
+# Skip containers without any custom item
+execute unless items block ~ ~ ~ container.* *[minecraft:custom_data] run return fail
+
+# Only loop over the slots holding an item with custom data
+data modify storage tasty_supplies:updater SlotsTemp set value []
+data modify storage tasty_supplies:updater SlotsTemp append from block ~ ~ ~ Items[{components:{"minecraft:custom_data":{}}}]
+function tasty_supplies:updater/check/storage/loop
\ No newline at end of file
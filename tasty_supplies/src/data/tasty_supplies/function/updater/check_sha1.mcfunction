@@ -1 +0,0 @@
-execute if data storage tasty_supplies:updater temp{hash: "-1"} run return fail
\ No newline at end of file
@@ -0,0 +1 @@
+return run function tasty_supplies:updater/match_version with storage tasty_supplies:updater temp
\ No newline at end of file
@@ -1,3 +1,4 @@
-tag @s add raycast_origin
+## Requirements
+## @s => a player
 
-execute as @s anchored eyes positioned ^ ^ ^ anchored feet run return run function tasty_supplies:updater/find_storage/ray/start
\ No newline at end of file
+execute as @s rotated as @s anchored eyes positioned ^ ^ ^ anchored feet run return run function tasty_supplies:updater/find_storage/ray/start
\ No newline at end of file
@@ -0,0 +1,23 @@
+## Requirements
+## $ => the axis (x, y or z)
+
+# Offset of the origin inside its block
+$scoreboard players operation #f_$(axis) ts_cast_temp = #o_$(axis) ts_cast_temp
+$scoreboard players operation #f_$(axis) ts_cast_temp %= #1000 ts_cast_temp
+
+# The ray never crosses a boundary on this axis
+$execute if score #d_$(axis) ts_cast_temp matches 0 run scoreboard players set #step_$(axis) ts_cast_temp 0
+$execute if score #d_$(axis) ts_cast_temp matches 0 run return run scoreboard players set #tmax_$(axis) ts_cast_temp 1000000000
+
+# Distance to the first boundary and between two boundaries
+$execute if score #d_$(axis) ts_cast_temp matches 1.. run scoreboard players set #step_$(axis) ts_cast_temp 1
+$execute if score #d_$(axis) ts_cast_temp matches 1.. run scoreboard players operation #tmax_$(axis) ts_cast_temp = #1000 ts_cast_temp
+$execute if score #d_$(axis) ts_cast_temp matches 1.. run scoreboard players operation #tmax_$(axis) ts_cast_temp -= #f_$(axis) ts_cast_temp
+$execute if score #d_$(axis) ts_cast_temp matches ..-1 run scoreboard players set #step_$(axis) ts_cast_temp -1
+$execute if score #d_$(axis) ts_cast_temp matches ..-1 run scoreboard players operation #tmax_$(axis) ts_cast_temp = #f_$(axis) ts_cast_temp
+$execute if score #d_$(axis) ts_cast_temp matches ..-1 run scoreboard players operation #d_$(axis) ts_cast_temp *= #step_$(axis) ts_cast_temp
+
+$scoreboard players operation #tmax_$(axis) ts_cast_temp *= #1000 ts_cast_temp
+$scoreboard players operation #tmax_$(axis) ts_cast_temp /= #d_$(axis) ts_cast_temp
+$scoreboard players operation #tdelta_$(axis) ts_cast_temp = #1000000 ts_cast_temp
+$scoreboard players operation #tdelta_$(axis) ts_cast_temp /= #d_$(axis) ts_cast_temp
\ No newline at end of file
@@ -0,0 +1,19 @@
+## Requirements
+## @s => a temporary marker
+## @pos => the ray origin, rotated along the ray
+
+# Ray origin
+execute store result score #o_x ts_cast_temp run data get entity @s Pos[0] 1000
+execute store result score #o_y ts_cast_temp run data get entity @s Pos[1] 1000
+execute store result score #o_z ts_cast_temp run data get entity @s Pos[2] 1000
+
+# Ray direction (unit vector)
+tp @s ^ ^ ^1
+execute store result score #d_x ts_cast_temp run data get entity @s Pos[0] 1000
+execute store result score #d_y ts_cast_temp run data get entity @s Pos[1] 1000
+execute store result score #d_z ts_cast_temp run data get entity @s Pos[2] 1000
+scoreboard players operation #d_x ts_cast_temp -= #o_x ts_cast_temp
+scoreboard players operation #d_y ts_cast_temp -= #o_y ts_cast_temp
+scoreboard players operation #d_z ts_cast_temp -= #o_z ts_cast_temp
+
+kill @s
\ No newline at end of file
@@ -1,7 +1,17 @@
-tag @s add ts_ray
+## Requirements
+## @s => a player
+## @pos => the player's eyes, rotated as the player
+
+# Block boundary (DDA) traversal: one block check per block crossed by the ray,
+# up to the player's block interaction range. Distances are in 1/1000 block.
 scoreboard players set #hit ts_cast_temp 0
-scoreboard players set #distance ts_cast_temp 0
+scoreboard players set #1000 ts_cast_temp 1000
+scoreboard players set #1000000 ts_cast_temp 1000000
+execute store result score #range ts_cast_temp run attribute @s minecraft:block_interaction_range get 1000
 
-function tasty_supplies:updater/find_storage/ray/step
+execute summon minecraft:marker run function tasty_supplies:updater/find_storage/ray/setup
+function tasty_supplies:updater/find_storage/ray/axis {axis:"x"}
+function tasty_supplies:updater/find_storage/ray/axis {axis:"y"}
+function tasty_supplies:updater/find_storage/ray/axis {axis:"z"}
 
-tag @s remove ts_ray
\ No newline at end of file
+execute align xyz run function tasty_supplies:updater/find_storage/ray/step
\ No newline at end of file
@@ -1,5 +1,25 @@
-execute if data block ~ ~ ~ Items run function tasty_supplies:updater/find_storage/ray/hit
-scoreboard players add #distance ts_cast_temp 1
+## Requirements
+## @pos => the corner of the block crossed by the ray
 
-execute if score #hit ts_cast_temp matches 0 if score #distance ts_cast_temp matches 251.. run function tasty_supplies:updater/find_storage/ray/failed
-execute if score #hit ts_cast_temp matches 0 if score #distance ts_cast_temp matches ..250 positioned ^ ^ ^0.1 run function tasty_supplies:updater/find_storage/ray/step
\ No newline at end of file
+execute if data block ~ ~ ~ Items run return run function tasty_supplies:updater/find_storage/ray/hit
+
+# Move to the next block along the axis whose boundary is the closest
+scoreboard players set #axis ts_cast_temp 0
+scoreboard players operation #t ts_cast_temp = #tmax_x ts_cast_temp
+execute if score #tmax_y ts_cast_temp < #t ts_cast_temp run scoreboard players set #axis ts_cast_temp 1
+execute if score #tmax_y ts_cast_temp < #t ts_cast_temp run scoreboard players operation #t ts_cast_temp = #tmax_y ts_cast_temp
+execute if score #tmax_z ts_cast_temp < #t ts_cast_temp run scoreboard players set #axis ts_cast_temp 2
+execute if score #tmax_z ts_cast_temp < #t ts_cast_temp run scoreboard players operation #t ts_cast_temp = #tmax_z ts_cast_temp
+
+execute if score #t ts_cast_temp > #range ts_cast_temp run return run function tasty_supplies:updater/find_storage/ray/failed
+
+execute if score #axis ts_cast_temp matches 0 run scoreboard players operation #tmax_x ts_cast_temp += #tdelta_x ts_cast_temp
+execute if score #axis ts_cast_temp matches 1 run scoreboard players operation #tmax_y ts_cast_temp += #tdelta_y ts_cast_temp
+execute if score #axis ts_cast_temp matches 2 run scoreboard players operation #tmax_z ts_cast_temp += #tdelta_z ts_cast_temp
+
+execute if score #axis ts_cast_temp matches 0 if score #step_x ts_cast_temp matches 1 positioned ~1 ~ ~ run return run function tasty_supplies:updater/find_storage/ray/step
+execute if score #axis ts_cast_temp matches 0 if score #step_x ts_cast_temp matches -1 positioned ~-1 ~ ~ run return run function tasty_supplies:updater/find_storage/ray/step
+execute if score #axis ts_cast_temp matches 1 if score #step_y ts_cast_temp matches 1 positioned ~ ~1 ~ run return run function tasty_supplies:updater/find_storage/ray/step
+execute if score #axis ts_cast_temp matches 1 if score #step_y ts_cast_temp matches -1 positioned ~ ~-1 ~ run return run function tasty_supplies:updater/find_storage/ray/step
+execute if score #axis ts_cast_temp matches 2 if score #step_z ts_cast_temp matches 1 positioned ~ ~ ~1 run return run function tasty_supplies:updater/find_storage/ray/step
+execute if score #axis ts_cast_temp matches 2 if score #step_z ts_cast_temp matches -1 positioned ~ ~ ~-1 run return run function tasty_supplies:updater/find_storage/ray/step
\ No newline at end of file
@@ -0,0 +1,3 @@
+scoreboard objectives add ts_version dummy
+scoreboard objectives add ts_scanned dummy
+scoreboard players reset * ts_version
\ No newline at end of file
@@ -0,0 +1 @@
+$return run execute if score #stack ts_version = #$(item_name) ts_version
\ No newline at end of file
@@ -0,0 +1,4 @@
+## Requirements
+## @s => the player who opened an ender chest
+
+function tasty_supplies:updater/check/enderchest/main
\ No newline at end of file
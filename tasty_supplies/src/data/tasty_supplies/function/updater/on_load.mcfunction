@@ -1,7 +1,8 @@
 scoreboard objectives add ts_cast_temp dummy
 scoreboard objectives add ts_operation_temp dummy
-scoreboard objectives add ts_loop_index dummy
+scoreboard objectives add ts_queue dummy
 
-execute as @e if data entity @s Inventory run function tasty_supplies:updater/check/inventory/main
-execute as @e if data entity @s EnderItems run function tasty_supplies:updater/check/enderchest/main
-execute as @e if data entity @s equipment run function tasty_supplies:updater/check/equipment
+# Dropped items checked by a previous version of the pack are checked again
+tag @e[type=minecraft:item, tag=ts_checked] remove ts_checked
+
+function tasty_supplies:updater/scan_all
@@ -1 +1,2 @@
-execute as @e if data entity @s Item run function tasty_supplies:updater/check/item {data_path:"Item", item_path:"contents", target:"entity @s"}
\ No newline at end of file
+# Each dropped stack is only checked once in its lifetime
+execute as @e[type=minecraft:item, tag=!ts_checked] run function tasty_supplies:updater/check/dropped_item
\ No newline at end of file
@@ -0,0 +1,10 @@
+## Requirements
+## @s => a queued entity
+
+tag @s remove ts_scan_queued
+scoreboard players add #batch ts_queue 1
+execute if entity @s[type=minecraft:player] run return run function tasty_supplies:updater/check/player
+
+execute if data entity @s Inventory run function tasty_supplies:updater/check/inventory/main
+execute if data entity @s EnderItems run function tasty_supplies:updater/check/enderchest/main
+execute if data entity @s equipment run function tasty_supplies:updater/check/equipment
\ No newline at end of file
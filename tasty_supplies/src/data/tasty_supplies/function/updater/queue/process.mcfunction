@@ -0,0 +1,15 @@
+# Drop the queue if the updater was disabled meanwhile
+execute if score #ts_settings disable_update matches 1.. run return run tag @e[tag=ts_scan_queued] remove ts_scan_queued
+
+# Checks at most `#ts_settings scan_budget` queued entities per tick
+scoreboard players set #batch ts_queue 0
+execute store result storage tasty_supplies:updater queue.budget int 1 run scoreboard players get #ts_settings scan_budget
+function tasty_supplies:updater/queue/process_batch with storage tasty_supplies:updater queue
+
+# Queue statistics
+scoreboard players operation #processed ts_queue += #batch ts_queue
+execute store result storage tasty_supplies:updater queue.last_batch int 1 run scoreboard players get #batch ts_queue
+execute store result storage tasty_supplies:updater queue.processed int 1 run scoreboard players get #processed ts_queue
+execute store result storage tasty_supplies:updater queue.depth int 1 store result score #depth ts_queue if entity @e[tag=ts_scan_queued]
+
+execute if score #depth ts_queue matches 1.. run schedule function tasty_supplies:updater/queue/process 1t
\ No newline at end of file
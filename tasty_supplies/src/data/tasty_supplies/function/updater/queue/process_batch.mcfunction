@@ -0,0 +1 @@
+$execute as @e[tag=ts_scan_queued, limit=$(budget)] run function tasty_supplies:updater/queue/check_entity
\ No newline at end of file
@@ -0,0 +1,5 @@
+## Requirements
+## entities to check must be tagged with ts_scan_queued
+
+execute store result storage tasty_supplies:updater queue.depth int 1 if entity @e[tag=ts_scan_queued]
+schedule function tasty_supplies:updater/queue/process 1t
\ No newline at end of file
@@ -0,0 +1,2 @@
+$execute unless score #$(item_name) ts_version matches 1.. run return fail
+$return run item modify $(target) $(path) tasty_supplies:updater/$(item_name)
\ No newline at end of file
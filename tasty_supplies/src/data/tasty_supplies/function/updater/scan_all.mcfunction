@@ -0,0 +1,4 @@
+# Queues every loaded entity that can hold items, they are checked over the
+# next ticks (e.g. on load)
+tag @e[type=#tasty_supplies:item_holders] add ts_scan_queued
+function tasty_supplies:updater/queue/start
\ No newline at end of file